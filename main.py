@@ -732,6 +732,11 @@ class SCRIBE:
         print(f"\nGenerated reports: {stats['reports_generated']}")
         print("=" * 60 + "\n")
 
+    def close(self):
+        """Release the notifiers' HTTP sessions."""
+        self.discord_notifier.close()
+        self.synology_notifier.close()
+
 
 def main():
     """Main entry point."""
@@ -804,6 +809,7 @@ def main():
         sys.exit(1)
 
     # Initialize and run
+    scribe = None
     try:
         scribe = SCRIBE(package_name=args.package, language=args.language)
 
@@ -818,6 +824,9 @@ def main():
     except Exception as e:
         logging.error(f"Error running SCRIBE: {e}")
         sys.exit(1)
+    finally:
+        if scribe is not None:
+            scribe.close()
 
 
 if __name__ == "__main__":
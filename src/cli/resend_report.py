@@ -447,51 +447,55 @@ def main():
         package_display_name=pkg.display_name
     )
 
-    # Send to Discord
-    discord_success = None
-    if not args.synology_only:
-        if args.summary:
-            # Send summary
-            discord_success = send_summary_to_discord(
-                fallback_manager=fallback_manager,
-                discord_notifier=discord_notifier,
-                ollama_client=ollama_client,
-                report_path=report_path,
-                mention_role=discord_config.get('summary', {}).get('mention_role', '')
-            )
-        else:
-            # Send full report
-            use_rich = not args.text_only and discord_config.get('rich_embeds', True)
-            discord_success = send_to_discord(
-                fallback_manager=fallback_manager,
-                discord_notifier=discord_notifier,
-                report_path=report_path,
-                use_rich=use_rich,
-                mention_role=discord_config.get('mention_role', ''),
-                no_retry=args.no_retry
-            )
-
-    # Send to Synology
-    synology_success = None
-    if not args.discord_only:
-        if args.summary:
-            # Send summary
-            synology_success = send_summary_to_synology(
-                fallback_manager=fallback_manager,
-                synology_notifier=synology_notifier,
-                ollama_client=ollama_client,
-                report_path=report_path,
-                mention=synology_config.get('summary', {}).get('mention', '')
-            )
-        else:
-            # Send full report
-            synology_success = send_to_synology(
-                fallback_manager=fallback_manager,
-                synology_notifier=synology_notifier,
-                report_path=report_path,
-                mention=synology_config.get('mention', ''),
-                no_retry=args.no_retry
-            )
+    try:
+        # Send to Discord
+        discord_success = None
+        if not args.synology_only:
+            if args.summary:
+                # Send summary
+                discord_success = send_summary_to_discord(
+                    fallback_manager=fallback_manager,
+                    discord_notifier=discord_notifier,
+                    ollama_client=ollama_client,
+                    report_path=report_path,
+                    mention_role=discord_config.get('summary', {}).get('mention_role', '')
+                )
+            else:
+                # Send full report
+                use_rich = not args.text_only and discord_config.get('rich_embeds', True)
+                discord_success = send_to_discord(
+                    fallback_manager=fallback_manager,
+                    discord_notifier=discord_notifier,
+                    report_path=report_path,
+                    use_rich=use_rich,
+                    mention_role=discord_config.get('mention_role', ''),
+                    no_retry=args.no_retry
+                )
+
+        # Send to Synology
+        synology_success = None
+        if not args.discord_only:
+            if args.summary:
+                # Send summary
+                synology_success = send_summary_to_synology(
+                    fallback_manager=fallback_manager,
+                    synology_notifier=synology_notifier,
+                    ollama_client=ollama_client,
+                    report_path=report_path,
+                    mention=synology_config.get('summary', {}).get('mention', '')
+                )
+            else:
+                # Send full report
+                synology_success = send_to_synology(
+                    fallback_manager=fallback_manager,
+                    synology_notifier=synology_notifier,
+                    report_path=report_path,
+                    mention=synology_config.get('mention', ''),
+                    no_retry=args.no_retry
+                )
+    finally:
+        discord_notifier.close()
+        synology_notifier.close()
 
     # Summary
     print("\n" + "=" * 60)
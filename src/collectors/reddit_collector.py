@@ -1,12 +1,20 @@
 """Reddit data collector via PRAW"""
 
 import os
+import re
 import logging
 from typing import List, Dict, Any
 from datetime import datetime, timedelta
+from html import unescape
 import praw
 
 
+# Direct image link (extension at the end of the path, query/fragment allowed)
+_IMAGE_EXT_RE = re.compile(r'\.(?:jpe?g|png|gif|webp)(?:[?#]|$)', re.IGNORECASE)
+# Image hosts: Reddit (i.redd.it) and imgur (albums/galleries can't be made direct)
+_IMAGE_HOST_RE = re.compile(r'(?P<reddit>i\.redd\.it)|imgur\.com/(?P<album>a/|gallery/)?', re.IGNORECASE)
+
+
 class RedditCollector:
     """Collects Reddit posts and comments about AI"""
 
@@ -93,18 +101,18 @@ class RedditCollector:
 
                 subreddit = self.reddit.subreddit(subreddit_name)
 
-                # Get posts based on sort method
+                # Get posts based on sort method (lazy listing, consumed until posts_limit is reached)
                 if sort_by == 'hot':
-                    posts = list(subreddit.hot(limit=posts_limit * 2))  # Fetch extra for filtering
+                    posts = subreddit.hot(limit=posts_limit * 2)  # Fetch extra for filtering
                 elif sort_by == 'top':
-                    posts = list(subreddit.top(time_filter=timeframe, limit=posts_limit * 2))
+                    posts = subreddit.top(time_filter=timeframe, limit=posts_limit * 2)
                 elif sort_by == 'rising':
-                    posts = list(subreddit.rising(limit=posts_limit * 2))
+                    posts = subreddit.rising(limit=posts_limit * 2)
                 elif sort_by == 'new':
-                    posts = list(subreddit.new(limit=posts_limit * 2))
+                    posts = subreddit.new(limit=posts_limit * 2)
                 else:
                     self.logger.warning(f"Unknown sort method '{sort_by}', using 'hot'")
-                    posts = list(subreddit.hot(limit=posts_limit * 2))
+                    posts = subreddit.hot(limit=posts_limit * 2)
 
                 # Extract and filter posts
                 collected = 0
@@ -169,22 +177,19 @@ class RedditCollector:
             Image URL string or None if no image found
         """
         try:
-            # Check if post URL is a direct image link
-            if post.url and any(post.url.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
-                return post.url
-
-            # Check for Reddit-hosted images (i.redd.it)
-            if post.url and 'i.redd.it' in post.url:
-                return post.url
-
-            # Check for imgur direct links
-            if post.url and 'imgur.com' in post.url:
-                # Convert imgur page to direct image if needed
-                if not any(post.url.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
-                    # Try to get direct link by adding .jpg
-                    if '/a/' not in post.url and '/gallery/' not in post.url:
-                        return post.url + '.jpg'
-                return post.url
+            url = post.url
+            if url:
+                # Direct image link
+                if _IMAGE_EXT_RE.search(url):
+                    return url
+
+                host = _IMAGE_HOST_RE.search(url)
+                if host:
+                    # Reddit-hosted image or imgur album/gallery: use as-is
+                    if host.group('reddit') or host.group('album'):
+                        return url
+                    # Imgur page: try to get direct link by adding .jpg
+                    return url + '.jpg'
 
             # Check for Reddit preview images
             if hasattr(post, 'preview') and post.preview:
@@ -194,7 +199,7 @@ class RedditCollector:
                     source = images[0].get('source', {})
                     if source.get('url'):
                         # Reddit encodes URLs, need to decode
-                        return source['url'].replace('&amp;', '&')
+                        return unescape(source['url'])
 
             # Check for Reddit gallery (multiple images) - get first image
             if hasattr(post, 'is_gallery') and post.is_gallery:
@@ -205,10 +210,10 @@ class RedditCollector:
                         if media.get('e') == 'Image':
                             # Get the source image
                             if 's' in media and 'u' in media['s']:
-                                return media['s']['u'].replace('&amp;', '&')
+                                return unescape(media['s']['u'])
                             elif 'p' in media and media['p']:
                                 # Fallback to preview
-                                return media['p'][-1]['u'].replace('&amp;', '&')
+                                return unescape(media['p'][-1]['u'])
 
             # Check post thumbnail as last resort (if it's a valid image)
             if hasattr(post, 'thumbnail') and post.thumbnail:
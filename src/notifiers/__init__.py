@@ -1 +1,15 @@
 # Notifiers module
+
+from typing import Any, Dict
+
+# Faster JSON encoding for webhook payloads when orjson is available
+try:
+    import orjson
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:
+        return orjson.dumps(payload)
+except ImportError:
+    import json
+
+    def _dumps(payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload).encode('utf-8')
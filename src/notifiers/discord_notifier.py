@@ -2,11 +2,65 @@
 
 import os
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from datetime import datetime
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.notifiers import _dumps
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Color mapping for different categories (Discord format)
+_CATEGORY_COLORS = {
+    "Large Language Models": 0x5865F2,  # Discord blurple
+    "Computer Vision": 0x57F287,  # Green
+    "Robotics": 0xFEE75C,  # Yellow
+    "Machine Learning": 0xEB459E,  # Pink
+    "Deep Learning": 0xED4245,  # Red
+    "Natural Language Processing": 0x3498DB,  # Blue
+    "Reinforcement Learning": 0xE67E22,  # Orange
+    "Generative AI": 0x9B59B6,  # Purple
+    "AI Ethics": 0x1ABC9C,  # Teal
+    "AI Research": 0x95A5A6,  # Gray
+}
+_DEFAULT_CATEGORY_COLOR = 0x99AAB5  # Default gray
+
+# Embed author field for each content source
+_SOURCE_AUTHORS = {
+    "reddit": {
+        "name": "Reddit",
+        "icon_url": "https://www.redditstatic.com/desktop2x/img/favicon/android-icon-192x192.png"
+    },
+    "youtube": {
+        "name": "YouTube",
+        "icon_url": "https://www.youtube.com/s/desktop/f506bd45/img/favicon_144x144.png"
+    },
+}
+
+
+@lru_cache(maxsize=128)
+def _category_color(category: str) -> int:
+    """Look up a category color, falling back to prefix matches (e.g. "Robotics & Embodied AI")"""
+    color = _CATEGORY_COLORS.get(category)
+    if color is not None or not category:
+        return color or _DEFAULT_CATEGORY_COLOR
+    for name, color in _CATEGORY_COLORS.items():
+        if category.startswith(name):
+            return color
+    return _DEFAULT_CATEGORY_COLOR
+
+
+@lru_cache(maxsize=256)
+def _youtube_thumbnail(video_id: str) -> str:
+    """Thumbnail URL for a YouTube video (cached: the same videos recur across messages)"""
+    return f"https://img.youtube.com/vi/{video_id}/maxresdefault.jpg"
 
 
 class DiscordNotifier:
@@ -16,10 +70,23 @@ class DiscordNotifier:
     MAX_MESSAGE_LENGTH = 2000
     # Discord embed description limit
     MAX_EMBED_DESCRIPTION = 4096
-    # Delay between messages to avoid rate limiting (in seconds)
+    # Delay between messages when Discord sends no rate limit headers (in seconds)
     MESSAGE_DELAY = 1.0
     # Maximum embeds per message
     MAX_EMBEDS_PER_MESSAGE = 10
+    # Maximum total characters across all embeds of one message
+    MAX_EMBED_TOTAL_CHARS = 6000
+    # Worker threads used when parallel_sends is enabled
+    PARALLEL_SEND_WORKERS = 5
+    # Report header, filled with the upper-cased display name and the report date/time
+    HEADER_TEMPLATE = "# {title}\n\n---\n\n## {timestamp}\n\n---"
+
+    # Rate limit state shared by all instances, since Discord limits per webhook:
+    # bucket -> (remaining requests, monotonic reset time)
+    _rate_limits: Dict[str, tuple] = {}
+    # Webhook URL -> X-RateLimit-Bucket id, learned from responses
+    _url_buckets: Dict[str, str] = {}
+    _rate_lock = threading.Lock()
 
     def __init__(self, config: dict, package_display_name: str = "AI Trends & Innovations"):
         """
@@ -32,6 +99,7 @@ class DiscordNotifier:
         self.logger = logging.getLogger("SCRIBE.DiscordNotifier")
         self.config = config
         self.package_display_name = package_display_name
+        self._header_title = package_display_name.upper()
 
         # Get webhook from config env var reference
         webhook_env = config.get('webhook_env', 'DISCORD_WEBHOOK_URL')
@@ -44,11 +112,19 @@ class DiscordNotifier:
         # Get additional config options
         self.rich_embeds = config.get('rich_embeds', True)
         self.max_length = config.get('max_length', 1900)
+        # Send embed batches concurrently (faster, but Discord may show them out of order)
+        self.parallel_sends = config.get('parallel_sends', False)
 
         # Forum channel support
         self.thread_name = config.get('thread_name', None)  # Optional thread name for forum channels (main webhook)
         self.summary_thread_name = summary_config.get('thread_name', None)  # Optional thread name for summary webhook
 
+        # Persistent session: keeps the TLS connection to discord.com warm across messages.
+        # No urllib3 retries: webhooks are POSTs (never retried, so a message is never
+        # sent twice) and HTTP 429 is handled by _post from Discord's rate limit headers
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+
         if not self.webhook_url:
             self.logger.warning("Discord webhook URL not configured. Discord notifications disabled.")
         else:
@@ -57,13 +133,29 @@ class DiscordNotifier:
         if self.summary_webhook_url:
             self.logger.info("Discord summary webhook configured")
 
-    def send_full_report(self, report_path: str, mention_role: str = "") -> bool:
+    def close(self):
+        """Close the underlying HTTP session"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def send_full_report(
+        self,
+        report_path: str = None,
+        mention_role: str = "",
+        report_content: str = None
+    ) -> bool:
         """
         Send the complete report content to Discord webhook
 
         Args:
             report_path: Path to the generated report file
             mention_role: Optional role to mention (e.g., "@everyone")
+            report_content: Already loaded report content (skips reading report_path)
 
         Returns:
             True if successful, False otherwise
@@ -73,9 +165,10 @@ class DiscordNotifier:
             return False
 
         try:
-            # Read the full report
-            with open(report_path, 'r', encoding='utf-8') as f:
-                report_content = f.read()
+            # Read the full report unless the caller already loaded it
+            if report_content is None:
+                with open(report_path, 'r', encoding='utf-8') as f:
+                    report_content = f.read()
 
             # Clean up markdown for Discord (remove triple backticks that might interfere)
             report_content = self._clean_markdown_for_discord(report_content)
@@ -108,10 +201,6 @@ class DiscordNotifier:
 
                 self.logger.info(f"Sent part {i}/{len(message_chunks)}")
 
-                # Add delay between messages to avoid rate limiting
-                if i < len(message_chunks):
-                    time.sleep(self.MESSAGE_DELAY)
-
             self.logger.info(f"Full report sent successfully ({len(message_chunks)} part(s))")
             return True
 
@@ -137,16 +226,17 @@ class DiscordNotifier:
             mention_role: Optional role to mention (e.g., "@everyone")
 
         Returns:
-            True if successful, False otherwise
+            True if successful (or nothing to send), False otherwise
         """
+        # Nothing to report: succeed without any HTTP work (and without triggering the fallback)
+        if not relevant_contents:
+            self.logger.debug("send_rich_report called with empty list; skipping")
+            return True
+
         if not self.webhook_url:
             self.logger.warning("Cannot send Discord notification: webhook URL not configured")
             return False
 
-        if not relevant_contents:
-            self.logger.warning("No contents to send")
-            return False
-
         try:
             # Send header message first and capture thread_id if created
             header_message = self._create_header_message(len(relevant_contents), mention_role)
@@ -158,38 +248,20 @@ class DiscordNotifier:
             if thread_id and self.thread_name:
                 self.logger.info(f"Created forum thread with ID: {thread_id}")
 
-            time.sleep(self.MESSAGE_DELAY)
-
-            # Group contents by category for organized display
-            by_category = {}
-            for content in relevant_contents:
-                category = content.get('category', 'Other')
-                if category not in by_category:
-                    by_category[category] = []
-                by_category[category].append(content)
-
-            # Send embeds for each category (posting to thread if forum channel)
-            for category, contents in by_category.items():
-                # Send embeds in batches (Discord allows max 10 embeds per message)
-                embeds_batch = []
-                for content in contents:
-                    embed = self._create_content_embed(content, category)
-                    embeds_batch.append(embed)
-
-                    # Send batch when full or at end
-                    if len(embeds_batch) >= self.MAX_EMBEDS_PER_MESSAGE:
-                        success, _ = self._send_embeds(embeds_batch, thread_id=thread_id)
-                        if not success:
-                            self.logger.warning(f"Failed to send embeds batch for {category}")
-                        embeds_batch = []
-                        time.sleep(self.MESSAGE_DELAY)
-
-                # Send remaining embeds
-                if embeds_batch:
-                    success, _ = self._send_embeds(embeds_batch, thread_id=thread_id)
-                    if not success:
-                        self.logger.warning(f"Failed to send final embeds batch for {category}")
-                    time.sleep(self.MESSAGE_DELAY)
+            # Send embeds in as few messages as possible (posting to thread if forum channel)
+            batches = self._build_embed_batches(relevant_contents)
+            if self.parallel_sends and len(batches) > 1:
+                # Concurrent batches share the pooled session and rate limiter (order not guaranteed)
+                with ThreadPoolExecutor(max_workers=self.PARALLEL_SEND_WORKERS) as executor:
+                    results = list(executor.map(
+                        lambda batch: self._send_embeds(batch, thread_id=thread_id), batches
+                    ))
+            else:
+                results = [self._send_embeds(batch, thread_id=thread_id) for batch in batches]
+
+            for i, (success, _) in enumerate(results, 1):
+                if not success:
+                    self.logger.warning(f"Failed to send embeds batch {i}/{len(batches)}")
 
             # Send footer (posting to thread if forum channel)
             footer_message = f"---\n*Report generated by SCRIBE - {len(relevant_contents)} insights total*"
@@ -208,13 +280,55 @@ class DiscordNotifier:
             self.logger.error(f"Unexpected error sending Discord notification: {e}")
             return False
 
+    def _build_embed_batches(self, relevant_contents: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """
+        Build embeds grouped by category and pack them into per-message batches
+
+        Batches are filled across category boundaries, up to Discord's limits of
+        10 embeds and 6000 embed characters per message.
+
+        Args:
+            relevant_contents: List of analyzed content items with metadata
+
+        Returns:
+            List of embed batches, in category order
+        """
+        # Group contents by category for organized display
+        by_category = {}
+        for content in relevant_contents:
+            by_category.setdefault(content.get('category', 'Other'), []).append(content)
+
+        batches = []
+        batch, batch_chars = [], 0
+        for category, contents in by_category.items():
+            for content in contents:
+                embed = self._create_content_embed(content, category)
+                embed_chars = self._embed_char_count(embed)
+                if batch and (len(batch) >= self.MAX_EMBEDS_PER_MESSAGE
+                              or batch_chars + embed_chars > self.MAX_EMBED_TOTAL_CHARS):
+                    batches.append(batch)
+                    batch, batch_chars = [], 0
+                batch.append(embed)
+                batch_chars += embed_chars
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _embed_char_count(embed: Dict[str, Any]) -> int:
+        """Count the characters Discord includes in its per-message embed total"""
+        return (
+            len(embed.get('title', ''))
+            + len(embed.get('description', ''))
+            + len(embed.get('footer', {}).get('text', ''))
+            + len(embed.get('author', {}).get('name', ''))
+        )
+
     def _create_header_message(self, total_insights: int, mention_role: str = "") -> str:
         """Create the header message for the report"""
-        current_datetime = datetime.now()
-        formatted_date = current_datetime.strftime('%d %B %Y')
-        formatted_time = current_datetime.strftime('%H:%M')
-
-        header = f"# {self.package_display_name.upper()}\n\n---\n\n## {formatted_date} | {formatted_time}\n\n---"
+        timestamp = datetime.now().strftime('%d %B %Y | %H:%M')
+        header = self.HEADER_TEMPLATE.format(title=self._header_title, timestamp=timestamp)
 
         if mention_role:
             header = f"{mention_role}\n\n{header}"
@@ -263,59 +377,39 @@ class DiscordNotifier:
 
         description = "\n".join(description_parts)
 
-        # Create base embed
-        embed = {
-            "title": display_title,
-            "description": description,
-            "color": self._get_category_color(display_category),
-            "timestamp": datetime.utcnow().isoformat()
-        }
-
-        # Add URL if available
         metadata = content.get('metadata', {})
-        url = metadata.get('permalink') or metadata.get('url')
-        if url:
-            embed["url"] = url
+        source = metadata.get('source', 'unknown')
 
-        # Add image if available (Reddit posts)
+        # Image (Reddit posts) and thumbnail (YouTube video)
         image_url = metadata.get('image_url')
-        if image_url:
-            embed["image"] = {"url": image_url}
-
-        # Add thumbnail for YouTube (video thumbnail)
-        if metadata.get('source') == 'youtube' and metadata.get('video_id'):
-            thumbnail_url = f"https://img.youtube.com/vi/{metadata['video_id']}/maxresdefault.jpg"
-            embed["thumbnail"] = {"url": thumbnail_url}
-
-        # Add footer with metadata
-        footer_parts = []
-        score = content.get('relevance_score', 0)
-        footer_parts.append(f"Score: {score}")
+        thumbnail_url = None
+        if source == 'youtube' and metadata.get('video_id'):
+            thumbnail_url = _youtube_thumbnail(metadata['video_id'])
 
+        # Footer with metadata
+        footer_parts = [f"Score: {content.get('relevance_score', 0)}"]
         if metadata.get('author'):
             footer_parts.append(f"Author: {metadata['author']}")
         elif metadata.get('channel_title'):
             footer_parts.append(f"Channel: {metadata['channel_title']}")
-
         if metadata.get('subreddit'):
             footer_parts.append(f"r/{metadata['subreddit']}")
 
-        embed["footer"] = {"text": " | ".join(footer_parts)}
+        url = metadata.get('permalink') or metadata.get('url')
+        author = _SOURCE_AUTHORS.get(source)
 
-        # Add author field for source
-        source = metadata.get('source', 'unknown')
-        if source == 'reddit':
-            embed["author"] = {
-                "name": "Reddit",
-                "icon_url": "https://www.redditstatic.com/desktop2x/img/favicon/android-icon-192x192.png"
-            }
-        elif source == 'youtube':
-            embed["author"] = {
-                "name": "YouTube",
-                "icon_url": "https://www.youtube.com/s/desktop/f506bd45/img/favicon_144x144.png"
-            }
-
-        return embed
+        # Optional fields are only added when present
+        return {
+            "title": display_title,
+            "description": description,
+            "color": self._get_category_color(display_category),
+            "timestamp": datetime.utcnow().isoformat(),
+            **({"url": url} if url else {}),
+            **({"image": {"url": image_url}} if image_url else {}),
+            **({"thumbnail": {"url": thumbnail_url}} if thumbnail_url else {}),
+            "footer": {"text": " | ".join(footer_parts)},
+            **({"author": author} if author else {}),
+        }
 
     def _get_category_color(self, category: str) -> int:
         """
@@ -327,20 +421,7 @@ class DiscordNotifier:
         Returns:
             Color as integer (Discord format)
         """
-        # Color mapping for different categories
-        colors = {
-            "Large Language Models": 0x5865F2,  # Discord blurple
-            "Computer Vision": 0x57F287,  # Green
-            "Robotics": 0xFEE75C,  # Yellow
-            "Machine Learning": 0xEB459E,  # Pink
-            "Deep Learning": 0xED4245,  # Red
-            "Natural Language Processing": 0x3498DB,  # Blue
-            "Reinforcement Learning": 0xE67E22,  # Orange
-            "Generative AI": 0x9B59B6,  # Purple
-            "AI Ethics": 0x1ABC9C,  # Teal
-            "AI Research": 0x95A5A6,  # Gray
-        }
-        return colors.get(category, 0x99AAB5)  # Default gray
+        return _category_color(category)
 
     def _send_message(self, content: str, webhook_url: str = None, thread_id: str = None, thread_name: str = None) -> tuple[bool, str]:
         """
@@ -372,7 +453,7 @@ class DiscordNotifier:
                     payload["thread_name"] = use_thread_name
                 url = webhook_url or self.webhook_url
 
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._post(url, payload)
 
             if response.status_code in (200, 204):
                 # Extract thread_id from response if this created a new thread
@@ -415,7 +496,7 @@ class DiscordNotifier:
                     payload["thread_name"] = self.thread_name
                 url = webhook_url or self.webhook_url
 
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._post(url, payload)
 
             if response.status_code not in (200, 204):
                 self.logger.error(f"Failed to send embeds: {response.status_code} - {response.text}")
@@ -432,6 +513,98 @@ class DiscordNotifier:
             self.logger.error(f"Failed to send embeds: {e}")
             return False, None
 
+    def _post(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """
+        POST a payload to a webhook, pacing requests by Discord's rate limit headers
+
+        Waits only when the webhook's bucket is exhausted, and retries once after
+        the advertised delay on HTTP 429.
+
+        Args:
+            url: Webhook URL (may include a thread_id query)
+            payload: JSON payload
+
+        Returns:
+            Response from Discord
+        """
+        webhook = url.split('?', 1)[0]
+        data = _dumps(payload)
+        self._wait_for_rate_limit(webhook)
+        response = self._session.post(url, data=data, headers=_JSON_HEADERS, timeout=10)
+
+        if response.status_code == 429:
+            retry_after = self._retry_after(response)
+            self.logger.warning(f"Rate limited by Discord, retrying in {retry_after:.2f}s")
+            time.sleep(retry_after)
+            response = self._session.post(url, data=data, headers=_JSON_HEADERS, timeout=10)
+
+        self._update_rate_limit(webhook, response)
+        return response
+
+    def next_available(self, webhook_url: str = None) -> float:
+        """
+        Seconds until the webhook can be sent to without hitting its rate limit
+
+        Args:
+            webhook_url: Webhook URL (defaults to self.webhook_url)
+
+        Returns:
+            Wait time in seconds (0.0 if a request is available now)
+        """
+        webhook = (webhook_url or self.webhook_url or '').split('?', 1)[0]
+        with self._rate_lock:
+            key = self._url_buckets.get(webhook, webhook)
+            remaining, reset_at = self._rate_limits.get(key, (1, 0.0))
+        if remaining > 0:
+            return 0.0
+        return max(0.0, reset_at - time.monotonic())
+
+    def _wait_for_rate_limit(self, webhook: str):
+        """Sleep until the webhook's rate limit bucket has a request available"""
+        with self._rate_lock:
+            key = self._url_buckets.get(webhook, webhook)
+            remaining, reset_at = self._rate_limits.get(key, (1, 0.0))
+            now = time.monotonic()
+            if now >= reset_at:
+                wait = 0.0
+            elif remaining > 0:
+                wait = 0.0
+                # Reserve a request so concurrent senders don't overshoot the bucket
+                self._rate_limits[key] = (remaining - 1, reset_at)
+            else:
+                wait = reset_at - now
+        if wait > 0:
+            time.sleep(wait)
+
+    def _update_rate_limit(self, webhook: str, response: requests.Response):
+        """Record the rate limit state advertised in Discord's response headers"""
+        headers = response.headers
+        try:
+            remaining = int(headers['X-RateLimit-Remaining'])
+            reset_after = float(headers['X-RateLimit-Reset-After'])
+        except (KeyError, ValueError):
+            # No rate limit info: fall back to a fixed delay between messages
+            remaining, reset_after = 0, self.MESSAGE_DELAY
+
+        with self._rate_lock:
+            bucket = headers.get('X-RateLimit-Bucket')
+            if bucket:
+                self._url_buckets[webhook] = bucket
+            key = bucket or webhook
+            self._rate_limits[key] = (remaining, time.monotonic() + reset_after)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """Read the retry delay (seconds) from a 429 response"""
+        try:
+            return float(response.json().get('retry_after'))
+        except (ValueError, TypeError, AttributeError):
+            pass
+        try:
+            return float(response.headers.get('Retry-After', 1.0))
+        except ValueError:
+            return 1.0
+
     def _clean_markdown_for_discord(self, content: str) -> str:
         """
         Clean up markdown content for better Discord rendering
@@ -635,10 +808,6 @@ class DiscordNotifier:
 
                 self.logger.info(f"Sent summary part {i}/{len(message_chunks)}")
 
-                # Add delay between messages to avoid rate limiting
-                if i < len(message_chunks):
-                    time.sleep(self.MESSAGE_DELAY)
-
             self.logger.info(f"Summary sent successfully ({len(summary_text)} chars, {len(message_chunks)} part(s))")
             return True
 
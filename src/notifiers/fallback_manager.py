@@ -1,6 +1,8 @@
 """Fallback manager for retrying failed notifications using persisted reports"""
 
+import os
 import logging
+import mmap
 import re
 import time
 from pathlib import Path
@@ -8,6 +10,30 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 
 
+# Parsed reports keyed by (path, st_mtime_ns, st_size), shared across manager instances.
+# Cached item lists are returned as-is: callers must not mutate them.
+_PARSE_CACHE: Dict[tuple, Optional[List[Dict[str, Any]]]] = {}
+_PARSE_CACHE_MAX = 16
+
+# Report structure, matched as bytes directly on the memory-mapped file
+# Category sections (## heading)
+_CATEGORY_PATTERN = re.compile(
+    rb'## (.+?)\n\n\*(\d+) insight\(s\)\*\n\n(.+?)(?=\n## |\n---\n\n---\n|$)', re.DOTALL
+)
+# Individual items within a category (### heading)
+_ITEM_PATTERN = re.compile(
+    rb'### \d+\. (.+?)\n\n(?:<!-- (.+?) -->\n\n)?(?:\*(.+?)\*\n\n)?(.+?)(?=\n### |\n\n---\n|$)', re.DOTALL
+)
+
+# Visible metadata fields (decoded text)
+_SCORE_PATTERN = re.compile(r'Relevance: (\d+)/10')
+_SOURCE_URL_PATTERN = re.compile(r'\[Source\]\((.+?)\)')
+_AUTHOR_PATTERN = re.compile(r'Author: (.+?)(?:\n|$)')
+_CHANNEL_PATTERN = re.compile(r'Channel: (.+?)(?:\n|$)')
+_DATE_PATTERN = re.compile(r'Date: (.+?)(?:\n|$)')
+_VIDEO_ID_PATTERN = re.compile(r'(?:v=|youtu\.be/)([a-zA-Z0-9_-]{11})')
+
+
 class FallbackManager:
     """Manages fallback retry mechanism for failed notifications"""
 
@@ -38,73 +64,37 @@ class FallbackManager:
             report_path: Path to the report file
 
         Returns:
-            List of content dictionaries compatible with notifiers, or None if parsing fails
+            List of content dictionaries compatible with notifiers, or None if parsing fails.
+            Results are cached per file version (mtime + size); do not mutate them.
         """
         try:
-            with open(report_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            stat = os.stat(report_path)
+            cache_key = (os.fspath(report_path), stat.st_mtime_ns, stat.st_size)
+            if cache_key in _PARSE_CACHE:
+                self.logger.debug(f"Using cached parse of report: {report_path}")
+                return _PARSE_CACHE[cache_key]
 
             self.logger.info(f"Parsing report: {report_path}")
 
-            # Extract all content items
+            # Extract all content items (empty files can't be mapped, and hold no items)
             items = []
-
-            # Split by category sections (## heading)
-            category_pattern = r'## (.+?)\n\n\*(\d+) insight\(s\)\*\n\n(.+?)(?=\n## |\n---\n\n---\n|$)'
-            category_matches = re.finditer(category_pattern, content, re.DOTALL)
-
-            for category_match in category_matches:
-                category = category_match.group(1).strip()
-                category_content = category_match.group(3)
-
-                # Extract individual items within this category (### heading)
-                item_pattern = r'### \d+\. (.+?)\n\n(?:<!-- (.+?) -->\n\n)?(?:\*(.+?)\*\n\n)?(.+?)(?=\n### |\n\n---\n|$)'
-                item_matches = re.finditer(item_pattern, category_content, re.DOTALL)
-
-                for item_match in item_matches:
-                    title = item_match.group(1).strip()
-                    hidden_meta_str = item_match.group(2)  # HTML comment metadata
-                    hook = item_match.group(3).strip() if item_match.group(3) else None
-                    body = item_match.group(4).strip()
-
-                    # Extract insights (everything before metadata section)
-                    metadata_marker = body.find('📎 **Metadata**')
-                    if metadata_marker != -1:
-                        insights = body[:metadata_marker].strip()
-                        metadata_text = body[metadata_marker:]
+            if stat.st_size:
+                with open(report_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    # Reports written in text mode on Windows use CRLF: normalize
+                    # (this copy is only paid for such files)
+                    if content.find(b'\r\n') != -1:
+                        items = self._parse_items(content[:].replace(b'\r\n', b'\n'))
                     else:
-                        insights = body
-                        metadata_text = ""
-
-                    # Parse metadata (visible)
-                    metadata = self._parse_metadata(metadata_text)
-
-                    # Parse hidden metadata from HTML comment
-                    if hidden_meta_str:
-                        hidden_meta = self._parse_hidden_metadata(hidden_meta_str)
-                        metadata.update(hidden_meta)
-
-                    # Extract relevance score from metadata text
-                    score_match = re.search(r'Relevance: (\d+)/10', metadata_text)
-                    relevance_score = int(score_match.group(1)) if score_match else 7
-
-                    # Build content item
-                    item = {
-                        'title': title,
-                        'translated_title': title,  # Already translated in report
-                        'hook': hook,
-                        'insights': insights,
-                        'category': category,
-                        'relevance_score': relevance_score,
-                        'is_relevant': True,
-                        'metadata': metadata
-                    }
-
-                    items.append(item)
-                    self.logger.debug(f"Parsed item: {title[:50]}... (category: {category})")
+                        items = self._parse_items(content)
 
             self.logger.info(f"Successfully parsed {len(items)} items from report")
-            return items if items else None
+            result = items if items else None
+
+            if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX:
+                _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+            _PARSE_CACHE[cache_key] = result
+            return result
 
         except FileNotFoundError:
             self.logger.error(f"Report file not found: {report_path}")
@@ -113,6 +103,66 @@ class FallbackManager:
             self.logger.error(f"Failed to parse report: {e}", exc_info=True)
             return None
 
+    def _parse_items(self, content: bytes) -> List[Dict[str, Any]]:
+        """
+        Extract content items from the raw report bytes
+
+        Args:
+            content: Report content (bytes or memory-mapped file)
+
+        Returns:
+            List of content dictionaries
+        """
+        items = []
+        for category_match in _CATEGORY_PATTERN.finditer(content):
+            category = category_match.group(1).decode('utf-8').strip()
+            category_content = category_match.group(3)
+
+            for item_match in _ITEM_PATTERN.finditer(category_content):
+                # Only the captured fields are decoded, never the whole file
+                title = item_match.group(1).decode('utf-8').strip()
+                hidden_meta_str = item_match.group(2).decode('utf-8') if item_match.group(2) else None  # HTML comment metadata
+                hook = item_match.group(3).decode('utf-8').strip() if item_match.group(3) else None
+                body = item_match.group(4).decode('utf-8').strip()
+
+                # Extract insights (everything before metadata section)
+                metadata_marker = body.find('📎 **Metadata**')
+                if metadata_marker != -1:
+                    insights = body[:metadata_marker].strip()
+                    metadata_text = body[metadata_marker:]
+                else:
+                    insights = body
+                    metadata_text = ""
+
+                # Parse metadata (visible)
+                metadata = self._parse_metadata(metadata_text)
+
+                # Parse hidden metadata from HTML comment
+                if hidden_meta_str:
+                    hidden_meta = self._parse_hidden_metadata(hidden_meta_str)
+                    metadata.update(hidden_meta)
+
+                # Extract relevance score from metadata text
+                score_match = _SCORE_PATTERN.search(metadata_text)
+                relevance_score = int(score_match.group(1)) if score_match else 7
+
+                # Build content item
+                item = {
+                    'title': title,
+                    'translated_title': title,  # Already translated in report
+                    'hook': hook,
+                    'insights': insights,
+                    'category': category,
+                    'relevance_score': relevance_score,
+                    'is_relevant': True,
+                    'metadata': metadata
+                }
+
+                items.append(item)
+                self.logger.debug(f"Parsed item: {title[:50]}... (category: {category})")
+
+        return items
+
     def _parse_metadata(self, metadata_text: str) -> Dict[str, Any]:
         """
         Parse metadata section from report
@@ -126,24 +176,24 @@ class FallbackManager:
         metadata = {}
 
         # Extract URL (Source link)
-        url_match = re.search(r'\[Source\]\((.+?)\)', metadata_text)
+        url_match = _SOURCE_URL_PATTERN.search(metadata_text)
         if url_match:
             url = url_match.group(1)
             metadata['url'] = url
             metadata['permalink'] = url
 
         # Extract author
-        author_match = re.search(r'Author: (.+?)(?:\n|$)', metadata_text)
+        author_match = _AUTHOR_PATTERN.search(metadata_text)
         if author_match:
             metadata['author'] = author_match.group(1).strip()
 
         # Extract channel
-        channel_match = re.search(r'Channel: (.+?)(?:\n|$)', metadata_text)
+        channel_match = _CHANNEL_PATTERN.search(metadata_text)
         if channel_match:
             metadata['channel_title'] = channel_match.group(1).strip()
 
         # Extract date
-        date_match = re.search(r'Date: (.+?)(?:\n|$)', metadata_text)
+        date_match = _DATE_PATTERN.search(metadata_text)
         if date_match:
             metadata['created_utc'] = date_match.group(1).strip()
 
@@ -154,7 +204,7 @@ class FallbackManager:
             elif 'youtube.com' in metadata['url'] or 'youtu.be' in metadata['url']:
                 metadata['source'] = 'youtube'
                 # Extract video ID for thumbnail
-                video_id_match = re.search(r'(?:v=|youtu\.be/)([a-zA-Z0-9_-]{11})', metadata['url'])
+                video_id_match = _VIDEO_ID_PATTERN.search(metadata['url'])
                 if video_id_match:
                     metadata['video_id'] = video_id_match.group(1)
             else:
@@ -256,22 +306,33 @@ class FallbackManager:
         Returns:
             Path to the report file, or None if not found
         """
-        if not self.report_dir.exists():
-            self.logger.warning(f"Report directory does not exist: {self.report_dir}")
-            return None
-
         # Pattern: <package_name>_report_YYYY-MM-DD.md
+        # (the directory is only stat'ed again to explain a miss)
         if date_str:
             report_name = f"{self.package_name}_report_{date_str}.md"
             report_path = self.report_dir / report_name
-            if report_path.exists():
+            if report_path.is_file():
                 return str(report_path)
+            if not self.report_dir.exists():
+                self.logger.warning(f"Report directory does not exist: {self.report_dir}")
         else:
-            # Find latest report
-            pattern = f"{self.package_name}_report_*.md"
-            reports = sorted(self.report_dir.glob(pattern), reverse=True)
-            if reports:
-                return str(reports[0])
+            # Find latest report: single scandir pass keeping the max name
+            # (ISO dates sort lexicographically, so no full sort is needed)
+            prefix = f"{self.package_name}_report_"
+            latest = None
+            try:
+                with os.scandir(self.report_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if (name.startswith(prefix) and name.endswith('.md')
+                                and (latest is None or name > latest)
+                                and entry.is_file()):
+                            latest = name
+            except FileNotFoundError:
+                self.logger.warning(f"Report directory does not exist: {self.report_dir}")
+                return None
+            if latest:
+                return str(self.report_dir / latest)
 
         return None
 
@@ -1,6 +1,7 @@
 """Synology Chat webhook notifier for SCRIBE reports"""
 
 import os
+import asyncio
 import logging
 import time
 from typing import Dict, Any, List
@@ -8,6 +9,9 @@ from datetime import datetime
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.notifiers import _dumps
 
 
 class SynologyNotifier:
@@ -17,6 +21,8 @@ class SynologyNotifier:
     MAX_MESSAGE_LENGTH = 2000
     # Delay between messages to avoid rate limiting (in seconds)
     MESSAGE_DELAY = 1.0
+    # Report header, filled with the upper-cased display name and the report date/time
+    HEADER_TEMPLATE = "# {title}\n\n---\n\n## {timestamp}\n\n---"
 
     def __init__(self, config: dict, package_display_name: str = "AI Trends & Innovations"):
         """
@@ -29,6 +35,7 @@ class SynologyNotifier:
         self.logger = logging.getLogger("SCRIBE.SynologyNotifier")
         self.config = config
         self.package_display_name = package_display_name
+        self._header_title = package_display_name.upper()
 
         # Get webhook URL from config env var reference
         webhook_env = config.get('webhook_env', 'SYNOLOGY_WEBHOOK_URL')
@@ -42,6 +49,12 @@ class SynologyNotifier:
         # Get additional config options
         self.max_length = config.get('max_length', 1900)
 
+        # Persistent session: keeps the (TLS) connection to the NAS open across messages
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
         if not self.webhook_url:
             self.logger.warning("Synology Chat webhook URL not configured. Synology notifications disabled.")
         else:
@@ -50,6 +63,16 @@ class SynologyNotifier:
         if self.summary_webhook_url:
             self.logger.info("Synology Chat summary webhook configured")
 
+    def close(self):
+        """Close the underlying HTTP session"""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def send_full_report(self, report_path: str, mention: str = "") -> bool:
         """
         Send the complete report content to Synology Chat webhook
@@ -171,11 +194,8 @@ class SynologyNotifier:
 
     def _create_header_message(self, total_insights: int, mention: str = "") -> str:
         """Create the header message for the report"""
-        current_datetime = datetime.now()
-        formatted_date = current_datetime.strftime('%d %B %Y')
-        formatted_time = current_datetime.strftime('%H:%M')
-
-        header = f"# {self.package_display_name.upper()}\n\n---\n\n## {formatted_date} | {formatted_time}\n\n---"
+        timestamp = datetime.now().strftime('%d %B %Y | %H:%M')
+        header = self.HEADER_TEMPLATE.format(title=self._header_title, timestamp=timestamp)
 
         if mention:
             header = f"{mention}\n\n{header}"
@@ -268,9 +288,9 @@ class SynologyNotifier:
 
             # Synology Chat expects the payload to be URL-encoded
             # and sent as the value of the 'payload' parameter
-            data = urlencode({"payload": str(payload).replace("'", '"')})
+            data = urlencode({"payload": _dumps(payload)})
 
-            response = requests.post(
+            response = self._session.post(
                 self.webhook_url,
                 data=data,
                 headers={'Content-Type': 'application/x-www-form-urlencoded'},
@@ -287,6 +307,10 @@ class SynologyNotifier:
             self.logger.error(f"Failed to send message to Synology Chat: {e}")
             return False
 
+    async def _send_message_async(self, text: str, file_url: str = None) -> bool:
+        """Non-blocking _send_message (runs the request in a worker thread)"""
+        return await asyncio.to_thread(self._send_message, text, file_url)
+
     def _split_message(self, message: str) -> List[str]:
         """
         Split a long message into multiple chunks that fit Synology Chat's character limit
@@ -17,6 +17,21 @@ load_dotenv()
 
 logger = logging.getLogger("SCRIBE.PackageManager")
 
+# Parsed YAML files shared by all PackageManager instances, keyed by
+# (path, st_mtime_ns, st_size) so an edited file is parsed again.
+# The returned dicts are shared: callers must not mutate them.
+_YAML_CACHE: Dict[tuple, Dict] = {}
+
+
+def _load_yaml(path: Path) -> Dict:
+    """Load a YAML file, reusing the parsed result while the file is unchanged."""
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if key not in _YAML_CACHE:
+        with open(path, 'r', encoding='utf-8') as f:
+            _YAML_CACHE[key] = yaml.safe_load(f) or {}
+    return _YAML_CACHE[key]
+
 
 class PackageConfig:
     """Configuration holder for a single package."""
@@ -88,8 +103,7 @@ class PackageManager:
         """Load global configuration shared by all packages."""
         global_path = self.config_dir / "global.yaml"
         if global_path.exists():
-            with open(global_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            return _load_yaml(global_path)
         logger.warning(f"Global config not found at {global_path}, using defaults")
         return {
             "ollama": {
@@ -126,15 +140,13 @@ class PackageManager:
         if not settings_path.exists():
             raise ValueError(f"settings.yaml not found in package '{package_name}'")
 
-        with open(settings_path, 'r', encoding='utf-8') as f:
-            settings = yaml.safe_load(f) or {}
+        settings = _load_yaml(settings_path)
 
         # Load prompts.yaml
         prompts_path = package_dir / "prompts.yaml"
         prompts = {}
         if prompts_path.exists():
-            with open(prompts_path, 'r', encoding='utf-8') as f:
-                prompts = yaml.safe_load(f) or {}
+            prompts = _load_yaml(prompts_path)
         else:
             logger.warning(f"prompts.yaml not found for package '{package_name}'")
 
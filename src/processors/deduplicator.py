@@ -20,7 +20,8 @@ class ContentDeduplicator:
         ollama_config: dict = None,
         use_fast_detection: bool = True,
         tfidf_threshold: float = 0.67,
-        simhash_threshold: float = 0.85
+        simhash_threshold: float = 0.85,
+        tfidf_vectorizer=None
     ):
         """
         Initializes the deduplicator
@@ -30,6 +31,7 @@ class ContentDeduplicator:
             use_fast_detection: Use fast similarity detection instead of LLM
             tfidf_threshold: Threshold for TF-IDF semantic similarity (0.67 recommended)
             simhash_threshold: Threshold for SimHash near-duplicate detection (0.85 recommended)
+            tfidf_vectorizer: Optional TfidfVectorizer pre-fitted on the corpus, shared with the detector
         """
         self.logger = logging.getLogger("SCRIBE.Deduplicator")
         self.use_fast_detection = use_fast_detection
@@ -40,7 +42,8 @@ class ContentDeduplicator:
         if use_fast_detection:
             self.fast_detector = FastSimilarityDetector(
                 tfidf_threshold=tfidf_threshold,
-                simhash_threshold=simhash_threshold
+                simhash_threshold=simhash_threshold,
+                tfidf_vectorizer=tfidf_vectorizer
             )
             self.logger.info(f"Fast similarity detector initialized (tfidf={tfidf_threshold}, simhash={simhash_threshold})")
 
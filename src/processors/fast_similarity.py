@@ -2,11 +2,64 @@
 
 import logging
 import re
+import threading
 from typing import List, Dict, Any, Tuple, Optional
 from collections import defaultdict
+from functools import lru_cache
 import hashlib
 
 
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_STEM_SUFFIXES = ('ing', 'ment', 'tion', 'sion', 'ness', 'able', 'ible', 'ity', 'ies', 'ance', 'ence', 'ly', 'ed', 'es', 's')
+
+# TfidfVectorizer parameters of the TF-IDF stage (also used for shared, corpus-fitted vectorizers)
+TFIDF_PARAMS = {
+    'lowercase': True,
+    'stop_words': 'english',
+    'max_features': 1000,
+    'ngram_range': (1, 2),
+}
+
+# Maximum texts kept in each per-detector cache (oldest entries are evicted first)
+_TEXT_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=8192)
+def _tokenize_text(text: str, use_stemming: bool) -> Tuple[str, ...]:
+    """
+    Tokenize text (memoized: the same texts are compared many times in pairwise loops).
+
+    Args:
+        text: Input text
+        use_stemming: Apply simple suffix stripping
+
+    Returns:
+        Tuple of tokens
+    """
+    # Lowercase and extract words
+    text = text.lower()
+    # Remove special characters, keep alphanumeric and spaces
+    text = _NON_ALNUM_RE.sub(' ', text)
+    # Split into words and filter empty
+    tokens = [w for w in text.split() if len(w) > 2]
+
+    if use_stemming:
+        # Simple suffix stripping (poor man's stemming)
+        # This helps match "improved" with "improvement", "capabilities" with "capability", etc.
+        stemmed = []
+        for token in tokens:
+            # Remove common suffixes
+            stem = token
+            for suffix in _STEM_SUFFIXES:
+                if len(stem) > 5 and stem.endswith(suffix):
+                    stem = stem[:-len(suffix)]
+                    break
+            stemmed.append(stem)
+        return tuple(stemmed)
+
+    return tuple(tokens)
+
+
 class FastSimilarityDetector:
     """
     Fast similarity detection using multiple algorithms in cascade.
@@ -18,7 +71,8 @@ class FastSimilarityDetector:
         simhash_threshold: float = 0.85,
         tfidf_threshold: float = 0.5,
         title_weight: float = 0.4,
-        use_embeddings: bool = False
+        use_embeddings: bool = False,
+        tfidf_vectorizer=None
     ):
         """
         Initialize the fast similarity detector.
@@ -28,6 +82,9 @@ class FastSimilarityDetector:
             tfidf_threshold: Threshold for TF-IDF cosine similarity (0-1)
             title_weight: Weight given to title vs content (0-1)
             use_embeddings: Whether to use sentence embeddings (slower but more accurate)
+            tfidf_vectorizer: Optional TfidfVectorizer(**TFIDF_PARAMS) already fitted on the corpus.
+                When given, texts are only transformed (rows cached per text)
+                instead of fitting a new vectorizer for every pair.
         """
         self.logger = logging.getLogger("SCRIBE.FastSimilarity")
         self.simhash_threshold = simhash_threshold
@@ -36,18 +93,29 @@ class FastSimilarityDetector:
         self.use_embeddings = use_embeddings
 
         # Lazy loading of ML components
-        self._vectorizer = None
+        self._vectorizer = tfidf_vectorizer
+        self._tfidf_rows = {}  # text -> TF-IDF row (with a shared vectorizer)
         self._tfidf_matrix = None
         self._corpus_texts = []
-        self._corpus_hashes = {}
+        self._corpus_hashes = {}  # (text, hash_bits) -> SimHash
+        self._token_sets = {}  # text -> frozenset of tokens
         self._embedding_model = None
         self._embeddings_cache = {}
+        # Detectors may be shared by threads: cache insertions/evictions are serialized
+        self._cache_lock = threading.Lock()
 
         self.logger.info(
             f"FastSimilarityDetector initialized "
             f"(simhash={simhash_threshold}, tfidf={tfidf_threshold})"
         )
 
+    def _bounded_put(self, cache: dict, key, value):
+        """Store a value in a per-text cache, evicting the oldest entry when it is full."""
+        with self._cache_lock:
+            if len(cache) >= _TEXT_CACHE_SIZE:
+                cache.pop(next(iter(cache)), None)
+            cache[key] = value
+
     def _tokenize(self, text: str, use_stemming: bool = True) -> List[str]:
         """
         Tokenize text into words for similarity analysis.
@@ -59,28 +127,7 @@ class FastSimilarityDetector:
         Returns:
             List of tokens
         """
-        # Lowercase and extract words
-        text = text.lower()
-        # Remove special characters, keep alphanumeric and spaces
-        text = re.sub(r'[^a-z0-9\s]', ' ', text)
-        # Split into words and filter empty
-        tokens = [w.strip() for w in text.split() if len(w.strip()) > 2]
-
-        if use_stemming:
-            # Simple suffix stripping (poor man's stemming)
-            # This helps match "improved" with "improvement", "capabilities" with "capability", etc.
-            stemmed = []
-            for token in tokens:
-                # Remove common suffixes
-                stem = token
-                for suffix in ['ing', 'ment', 'tion', 'sion', 'ness', 'able', 'ible', 'ity', 'ies', 'ance', 'ence', 'ly', 'ed', 'es', 's']:
-                    if len(stem) > 5 and stem.endswith(suffix):
-                        stem = stem[:-len(suffix)]
-                        break
-                stemmed.append(stem)
-            return stemmed
-
-        return tokens
+        return list(_tokenize_text(text, use_stemming))
 
     def _compute_simhash(self, text: str, hash_bits: int = 64) -> int:
         """
@@ -94,7 +141,27 @@ class FastSimilarityDetector:
         Returns:
             SimHash integer value
         """
-        tokens = self._tokenize(text)
+        # Texts are compared against many others: reuse fingerprints per text
+        cache_key = (text, hash_bits)
+        cached = self._corpus_hashes.get(cache_key)
+        if cached is not None:
+            return cached
+
+        simhash = self._simhash_tokens(self._tokenize(text), hash_bits)
+        self._bounded_put(self._corpus_hashes, cache_key, simhash)
+        return simhash
+
+    def _simhash_tokens(self, tokens: List[str], hash_bits: int) -> int:
+        """
+        Compute the SimHash fingerprint of a token list.
+
+        Args:
+            tokens: Tokens of the text
+            hash_bits: Number of bits in the hash
+
+        Returns:
+            SimHash integer value
+        """
         if not tokens:
             return 0
 
@@ -141,6 +208,33 @@ class FastSimilarityDetector:
         similarity = 1 - (hamming_distance / hash_bits)
         return similarity
 
+    def simhash(self, text: str) -> int:
+        """
+        Get the 64-bit SimHash fingerprint of a text (cached per text).
+
+        Args:
+            text: Input text
+
+        Returns:
+            SimHash integer value
+        """
+        return self._compute_simhash(text)
+
+    def cheap_hamming(self, hash1: int, hash2: int) -> float:
+        """
+        Normalized bit similarity of two 64-bit SimHashes (one xor + popcount).
+
+        Useful as a coarse prefilter before the full check_similarity cascade.
+
+        Args:
+            hash1: First SimHash
+            hash2: Second SimHash
+
+        Returns:
+            Similarity score (0-1)
+        """
+        return self._simhash_similarity(hash1, hash2)
+
     def _compute_tfidf_similarity(self, text1: str, text2: str) -> float:
         """
         Compute TF-IDF cosine similarity between two texts.
@@ -152,6 +246,9 @@ class FastSimilarityDetector:
         Returns:
             Cosine similarity score (0-1)
         """
+        if self._vectorizer is not None:
+            return self._shared_tfidf_similarity(text1, text2)
+
         try:
             from sklearn.feature_extraction.text import TfidfVectorizer
             from sklearn.metrics.pairwise import cosine_similarity
@@ -160,12 +257,7 @@ class FastSimilarityDetector:
             return 0.0
 
         # Create a simple vectorizer for pairwise comparison
-        vectorizer = TfidfVectorizer(
-            lowercase=True,
-            stop_words='english',
-            max_features=1000,
-            ngram_range=(1, 2)
-        )
+        vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
 
         try:
             tfidf_matrix = vectorizer.fit_transform([text1, text2])
@@ -175,6 +267,44 @@ class FastSimilarityDetector:
             self.logger.debug(f"TF-IDF error: {e}")
             return 0.0
 
+    def _shared_tfidf_similarity(self, text1: str, text2: str) -> float:
+        """
+        Compute TF-IDF cosine similarity with the shared, pre-fitted vectorizer.
+
+        Args:
+            text1: First text
+            text2: Second text
+
+        Returns:
+            Cosine similarity score (0-1)
+        """
+        try:
+            row1 = self._tfidf_row(text1)
+            row2 = self._tfidf_row(text2)
+            norm = (row1.multiply(row1).sum() * row2.multiply(row2).sum()) ** 0.5
+            if not norm:
+                return 0.0
+            return float(row1.multiply(row2).sum() / norm)
+        except Exception as e:
+            self.logger.debug(f"TF-IDF error: {e}")
+            return 0.0
+
+    def _tfidf_row(self, text: str):
+        """
+        Get the (cached) TF-IDF row of a text from the shared vectorizer.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Sparse 1 x vocabulary matrix
+        """
+        row = self._tfidf_rows.get(text)
+        if row is None:
+            row = self._vectorizer.transform([text])
+            self._bounded_put(self._tfidf_rows, text, row)
+        return row
+
     def _compute_jaccard_similarity(self, text1: str, text2: str) -> float:
         """
         Compute Jaccard similarity between two texts (word overlap).
@@ -186,8 +316,8 @@ class FastSimilarityDetector:
         Returns:
             Jaccard similarity score (0-1)
         """
-        tokens1 = set(self._tokenize(text1))
-        tokens2 = set(self._tokenize(text2))
+        tokens1 = self._token_set(text1)
+        tokens2 = self._token_set(text2)
 
         if not tokens1 or not tokens2:
             return 0.0
@@ -197,6 +327,22 @@ class FastSimilarityDetector:
 
         return intersection / union if union > 0 else 0.0
 
+    def _token_set(self, text: str) -> frozenset:
+        """
+        Get the (cached) set of stemmed tokens of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Frozen set of tokens
+        """
+        tokens = self._token_sets.get(text)
+        if tokens is None:
+            tokens = frozenset(_tokenize_text(text, True))
+            self._bounded_put(self._token_sets, text, tokens)
+        return tokens
+
     def _title_similarity(self, title1: str, title2: str) -> float:
         """
         Compute similarity between titles using multiple methods.
@@ -9,6 +9,10 @@ import ollama
 from difflib import SequenceMatcher
 
 
+# Bold markdown text: **text**
+_BOLD_PATTERN = re.compile(r'\*\*([^\*]+?)\*\*')
+
+
 class OllamaClient:
     """Client to interact with Ollama using configuration from packages"""
 
@@ -41,6 +45,10 @@ class OllamaClient:
         # Create Ollama client with configured host
         self.client = ollama.Client(host=self.ollama_host)
 
+        # Daily summaries already generated by this client, keyed by prompt + linkable sources
+        # (a run may request the same summary for several notifiers)
+        self._summary_cache: Dict[tuple, str] = {}
+
         self.logger.info(f"Ollama client initialized with model: {self.model} on {self.ollama_host} (language: {language})")
         self._verify_model()
 
@@ -346,13 +354,6 @@ Contenu 2:
         Returns:
             Summary with bold text converted to linked bold text
         """
-        # Find all bold text patterns: **text**
-        bold_pattern = re.compile(r'\*\*([^\*]+?)\*\*')
-        bold_matches = bold_pattern.findall(summary)
-
-        if not bold_matches:
-            return summary
-
         # Build a mapping of titles to URLs
         title_url_map = {}
         for content in relevant_contents:
@@ -361,39 +362,57 @@ Contenu 2:
             if title and url:
                 title_url_map[title.lower()] = url
 
-        # Process each bold text and try to match with a title
-        result = summary
-        for bold_text in bold_matches:
+        if not title_url_map:
+            return summary
+
+        # Best URL per distinct bold text (the same text often appears several times)
+        matched_urls = {}
+
+        def find_best_url(bold_text: str) -> Optional[str]:
             best_match = None
             best_ratio = 0.0
             bold_lower = bold_text.lower()
 
             # Try to find the best matching title
             for title, url in title_url_map.items():
-                # Use fuzzy matching to handle variations
-                ratio = SequenceMatcher(None, bold_lower, title).ratio()
-
                 # Also check if bold text is contained in title or vice versa
-                if bold_lower in title or title in bold_lower:
+                is_substring = bold_lower in title or title in bold_lower
+
+                # Use fuzzy matching to handle variations
+                matcher = SequenceMatcher(None, bold_lower, title)
+                threshold = max(best_ratio, 0.6)  # Threshold of 60% similarity
+                # Cheap upper bounds first: skip titles that cannot beat the threshold
+                if not is_substring and (matcher.real_quick_ratio() <= threshold
+                                         or matcher.quick_ratio() <= threshold):
+                    continue
+                ratio = matcher.ratio()
+
+                if is_substring:
                     ratio = max(ratio, 0.85)  # Boost ratio for substring matches
 
-                if ratio > best_ratio and ratio > 0.6:  # Threshold of 60% similarity
+                if ratio > threshold:
                     best_ratio = ratio
                     best_match = url
 
-            # If we found a good match, replace bold with linked bold
             if best_match:
-                old_pattern = f'**{bold_text}**'
-                new_pattern = f'[**{bold_text}**]({best_match})'
-                # Only replace the first occurrence to avoid issues
-                result = result.replace(old_pattern, new_pattern, 1)
                 self.logger.debug(f"Linked '{bold_text}' to {best_match} (similarity: {best_ratio:.2f})")
+            return best_match
+
+        def link_bold(match) -> str:
+            bold_text = match.group(1)
+            if bold_text not in matched_urls:
+                matched_urls[bold_text] = find_best_url(bold_text)
+            url = matched_urls[bold_text]
+            # If we found a good match, replace bold with linked bold
+            return f'[**{bold_text}**]({url})' if url else match.group(0)
 
-        return result
+        # Single pass over the summary: each bold occurrence is linked in place
+        return _BOLD_PATTERN.sub(link_bold, summary)
 
     def generate_daily_summary(self, relevant_contents: List[Dict[str, Any]]) -> str:
         """
         Generates a daily summary for Discord (will be split if > 2000 chars)
+        Repeated calls with the same contents reuse the summary generated earlier
 
         Args:
             relevant_contents: List of analyzed content items with insights
@@ -424,12 +443,22 @@ Contenu 2:
 Key insights to summarize (sorted by relevance score, #1 is the TOP NEWS):
 {chr(10).join(insights_text)}"""
 
+        # Links depend on the titles/URLs of all contents, not just the prompted ones
+        cache_key = (system_prompt, user_prompt, tuple(
+            (content.get('translated_title', content.get('title', '')), content.get('url', ''))
+            for content in relevant_contents
+        ))
+        if cache_key in self._summary_cache:
+            self.logger.info("Reusing daily summary generated earlier for the same contents")
+            return self._summary_cache[cache_key]
+
         try:
             summary = self.generate(user_prompt, system_prompt)
 
             # Inject links into bold text in the summary
             summary_with_links = self._inject_links_in_summary(summary, relevant_contents)
 
+            self._summary_cache[cache_key] = summary_with_links
             return summary_with_links
 
         except Exception as e:
@@ -23,8 +23,16 @@ def load_config(config_path: str) -> Dict[str, Any]:
     return config
 
 
+# Set once .env has been loaded into os.environ (later calls are no-ops)
+_ENV_LOADED = False
+
+
 def load_env_variables():
-    """Load environment variables from .env"""
+    """Load environment variables from .env (parsed once per process)"""
+    global _ENV_LOADED
+
+    if _ENV_LOADED:
+        return
 
     env_path = Path(".env")
 
@@ -34,6 +42,7 @@ def load_env_variables():
         )
 
     load_dotenv(env_path, override=True)
+    _ENV_LOADED = True
 
 
 def get_project_root() -> Path:
@@ -58,9 +67,37 @@ def sanitize_filename(text: str, max_length: int = 100) -> str:
     return text
 
 
+def setup_logging(level: str = "INFO") -> logging.Logger:
+    """Setup console logging for the SCRIBE logger hierarchy.
+
+    Safe to call several times: handlers are only added on the first call.
+
+    Args:
+        level: Logging level (INFO, DEBUG, etc.)
+
+    Returns:
+        Root SCRIBE logger
+    """
+    logger = logging.getLogger("SCRIBE")
+    logger.setLevel(getattr(logging, level.upper()))
+
+    # Already configured: avoid duplicate handlers (each one would emit every record)
+    if logger.handlers:
+        return logger
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    logger.addHandler(console_handler)
+
+    return logger
+
+
 def setup_package_logging(package_name: str, level: str = "INFO") -> logging.Logger:
     """Setup logging for a specific package.
 
+    Records go to the package log file and, through the parent SCRIBE logger,
+    to its single console handler.
+
     Args:
         package_name: Name of the package
         level: Logging level (INFO, DEBUG, etc.)
@@ -68,30 +105,27 @@ def setup_package_logging(package_name: str, level: str = "INFO") -> logging.Log
     Returns:
         Logger configured for the package
     """
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    log_file = log_dir / f"{package_name}.log"
+    # Console output is handled once by the parent SCRIBE logger
+    setup_logging(level)
 
     # Create package-specific logger
     logger = logging.getLogger(f"SCRIBE.{package_name}")
     logger.setLevel(getattr(logging, level.upper()))
 
-    # Avoid duplicate handlers
-    if not logger.handlers:
-        # File handler
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
-        logger.addHandler(file_handler)
-
-        # Console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        ))
-        logger.addHandler(console_handler)
+    # Already configured: avoid duplicate handlers (and the log dir/file work)
+    if logger.handlers:
+        return logger
+
+    log_dir = Path("logs")
+    log_dir.mkdir(exist_ok=True)
+
+    log_file = log_dir / f"{package_name}.log"
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    # File handler
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
 
     return logger
 
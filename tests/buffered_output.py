@@ -0,0 +1,27 @@
+"""Per-thread stdout buffering shared by the test scripts that run phases concurrently"""
+
+import io
+import threading
+
+
+class ThreadBufferedStdout:
+    """Stdout proxy that redirects writes from worker threads into per-thread buffers."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def run_buffered(self, func):
+        """Run func with its output captured, returning (result, output)."""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(), self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
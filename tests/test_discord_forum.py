@@ -2,50 +2,81 @@
 
 import requests
 import time
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Test webhook URL pointing to a forum channel
 FORUM_WEBHOOK_URL = "https://discord.com/api/webhooks/1441708680851755171/gPlbj5fCsX-B4sn85wX1nz08So2kWoc3BD5euPCLNWXmrdM0f_7Js66SCKl53gsng_1H"
 
-def test_simple_message():
+# Shared session so the concurrent tests reuse pooled connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=5,
+    pool_maxsize=5,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+
+
+def post_webhook(payload: dict) -> requests.Response:
+    """
+    POST a payload to the forum webhook, retrying once on rate limit
+
+    Args:
+        payload: JSON payload to send
+
+    Returns:
+        Final response
+    """
+    response = SESSION.post(FORUM_WEBHOOK_URL, json=payload, timeout=(3, 7))
+    if response.status_code == 429:
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is None:
+            try:
+                retry_after = response.json().get('retry_after', 1)
+            except ValueError:
+                retry_after = 1
+        time.sleep(float(retry_after))
+        response = SESSION.post(FORUM_WEBHOOK_URL, json=payload, timeout=(3, 7))
+    return response
+
+
+def print_response(title: str, response: requests.Response):
+    """Print a test header and its response in one write (tests run concurrently)"""
+    print(f"\n=== {title} ===\nStatus: {response.status_code}\nResponse: {response.text}")
+
+
+def test_simple_message(ts: str, idx: int):
     """Test 1: Simple message without thread_name (should fail on forum)"""
-    print("\n=== Test 1: Simple message (no thread_name) ===")
     payload = {
         "content": "Test message without thread_name"
     }
 
-    response = requests.post(FORUM_WEBHOOK_URL, json=payload, timeout=10)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {response.text}")
+    response = post_webhook(payload)
+    print_response("Test 1: Simple message (no thread_name)", response)
 
     return response.status_code in (200, 204)
 
 
-def test_forum_thread_message():
+def test_forum_thread_message(ts: str, idx: int):
     """Test 2: Message with thread_name (should work on forum)"""
-    print("\n=== Test 2: Message with thread_name ===")
-
     # For forum channels, we need to specify thread_name
-    current_time = datetime.now().strftime('%H:%M:%S')
     payload = {
         "content": "✅ Test message avec thread_name - cela devrait créer un nouveau thread !",
-        "thread_name": f"🧪 Test SCRIBE - {current_time}"
+        "thread_name": f"🧪 Test SCRIBE - {ts}-{idx}"
     }
 
-    response = requests.post(FORUM_WEBHOOK_URL, json=payload, timeout=10)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {response.text}")
+    response = post_webhook(payload)
+    print_response("Test 2: Message with thread_name", response)
 
     return response.status_code in (200, 204)
 
 
-def test_forum_rich_embed():
+def test_forum_rich_embed(ts: str, idx: int):
     """Test 3: Rich embed with thread_name"""
-    print("\n=== Test 3: Rich embed in forum thread ===")
-
-    current_time = datetime.now().strftime('%H:%M:%S')
     payload = {
-        "thread_name": f"📊 Test Embed - {current_time}",
+        "thread_name": f"📊 Test Embed - {ts}-{idx}",
         "embeds": [{
             "title": "Test Rich Embed",
             "description": "Ceci est un test d'embed dans un canal forum avec thread_name",
@@ -69,20 +100,16 @@ def test_forum_rich_embed():
         }]
     }
 
-    response = requests.post(FORUM_WEBHOOK_URL, json=payload, timeout=10)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {response.text}")
+    response = post_webhook(payload)
+    print_response("Test 3: Rich embed in forum thread", response)
 
     return response.status_code in (200, 204)
 
 
-def test_forum_multiple_embeds():
+def test_forum_multiple_embeds(ts: str, idx: int):
     """Test 4: Multiple embeds in a forum thread"""
-    print("\n=== Test 4: Multiple embeds in forum thread ===")
-
-    current_time = datetime.now().strftime('%H:%M:%S')
     payload = {
-        "thread_name": f"📚 Test Multiple Embeds - {current_time}",
+        "thread_name": f"📚 Test Multiple Embeds - {ts}-{idx}",
         "embeds": [
             {
                 "title": "Embed 1",
@@ -99,20 +126,16 @@ def test_forum_multiple_embeds():
         ]
     }
 
-    response = requests.post(FORUM_WEBHOOK_URL, json=payload, timeout=10)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {response.text}")
+    response = post_webhook(payload)
+    print_response("Test 4: Multiple embeds in forum thread", response)
 
     return response.status_code in (200, 204)
 
 
-def test_forum_with_content_and_embeds():
+def test_forum_with_content_and_embeds(ts: str, idx: int):
     """Test 5: Content + embeds in forum thread"""
-    print("\n=== Test 5: Content + Embeds in forum thread ===")
-
-    current_time = datetime.now().strftime('%H:%M:%S')
     payload = {
-        "thread_name": f"💬 Test Complet - {current_time}",
+        "thread_name": f"💬 Test Complet - {ts}-{idx}",
         "content": "**Voici un message avec du contenu ET des embeds**",
         "embeds": [{
             "title": "Détails supplémentaires",
@@ -125,9 +148,8 @@ def test_forum_with_content_and_embeds():
         }]
     }
 
-    response = requests.post(FORUM_WEBHOOK_URL, json=payload, timeout=10)
-    print(f"Status: {response.status_code}")
-    print(f"Response: {response.text}")
+    response = post_webhook(payload)
+    print_response("Test 5: Content + Embeds in forum thread", response)
 
     return response.status_code in (200, 204)
 
@@ -137,26 +159,22 @@ if __name__ == "__main__":
     print("DISCORD FORUM CHANNEL WEBHOOK TESTS")
     print("=" * 70)
 
-    results = []
-
-    # Test 1: Without thread_name (expected to fail on forum)
-    results.append(("Simple message (no thread_name)", test_simple_message()))
-    time.sleep(2)
-
-    # Test 2: With thread_name (should work)
-    results.append(("Message with thread_name", test_forum_thread_message()))
-    time.sleep(2)
-
-    # Test 3: Rich embed
-    results.append(("Rich embed", test_forum_rich_embed()))
-    time.sleep(2)
-
-    # Test 4: Multiple embeds
-    results.append(("Multiple embeds", test_forum_multiple_embeds()))
-    time.sleep(2)
-
-    # Test 5: Content + embeds
-    results.append(("Content + Embeds", test_forum_with_content_and_embeds()))
+    tests = [
+        # Without thread_name (expected to fail on forum)
+        ("Simple message (no thread_name)", test_simple_message),
+        ("Message with thread_name", test_forum_thread_message),
+        ("Rich embed", test_forum_rich_embed),
+        ("Multiple embeds", test_forum_multiple_embeds),
+        ("Content + Embeds", test_forum_with_content_and_embeds),
+    ]
+
+    # One timestamp for the run; the index keeps thread names unique across parallel tests
+    ts = time.strftime('%H:%M:%S')
+
+    # Run all tests concurrently; rate limits are handled by post_webhook
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [(name, executor.submit(test, ts, idx)) for idx, (name, test) in enumerate(tests, 1)]
+        results = [(name, future.result()) for name, future in futures]
 
     # Summary
     print("\n" + "=" * 70)
@@ -7,11 +7,11 @@ Tests the new image extraction and Discord embed functionality
 import sys
 from pathlib import Path
 from datetime import datetime
+from html import unescape
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.utils import load_env_variables, setup_logging
 from src.notifiers.discord_notifier import DiscordNotifier
 
 
@@ -102,6 +102,10 @@ def test_embed_creation():
         print(f"Footer: {embed['footer']['text']}")
         print(f"Author: {embed.get('author', {}).get('name', 'N/A')}")
 
+    # Thumbnail URLs are cached per video_id
+    from src.notifiers.discord_notifier import _youtube_thumbnail
+    assert _youtube_thumbnail("dQw4w9WgXcQ") is _youtube_thumbnail("dQw4w9WgXcQ")
+
     # Test header message
     print("\n\n2. Testing header message creation...")
     header = notifier._create_header_message(len(test_contents), "@everyone")
@@ -120,6 +124,8 @@ def test_embed_creation():
         color = notifier._get_category_color(cat)
         print(f"  {cat}: {hex(color)}")
 
+    notifier.close()
+
     print("\n" + "=" * 60)
     print("Embed creation tests completed successfully!")
     print("=" * 60)
@@ -137,6 +143,7 @@ def test_send_to_discord(test_contents):
     print("=" * 60)
 
     try:
+        from src.utils import load_env_variables
         load_env_variables()
     except FileNotFoundError:
         print("No .env file found. Skipping Discord send test.")
@@ -154,10 +161,11 @@ def test_send_to_discord(test_contents):
 
     if response.lower() in ['yes', 'y', 'oui', 'o']:
         print("\nSending rich report to Discord...")
-        success = notifier.send_rich_report(
-            relevant_contents=test_contents,
-            mention_role=""  # No mention for test
-        )
+        with notifier:
+            success = notifier.send_rich_report(
+                relevant_contents=test_contents,
+                mention_role=""  # No mention for test
+            )
 
         if success:
             print("Test embeds sent successfully! Check your Discord channel.")
@@ -169,6 +177,7 @@ def test_send_to_discord(test_contents):
 
 def test_image_url_extraction_logic():
     """Test the image URL extraction patterns"""
+    from src.collectors.reddit_collector import _IMAGE_EXT_RE, _IMAGE_HOST_RE
 
     print("\n" + "=" * 60)
     print("Testing Image URL Detection Patterns")
@@ -197,19 +206,21 @@ def test_image_url_extraction_logic():
     for name, url in test_cases:
         post = MockPost(url)
 
-        # Check URL patterns
+        # Check URL patterns (same regexes as RedditCollector._extract_image_url)
         has_image = False
         reason = ""
 
-        if any(url.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
+        if _IMAGE_EXT_RE.search(url):
             has_image = True
             reason = "Direct image extension"
-        elif 'i.redd.it' in url:
-            has_image = True
-            reason = "Reddit hosted"
-        elif 'imgur.com' in url and '/a/' not in url and '/gallery/' not in url:
-            has_image = True
-            reason = "Imgur direct"
+        else:
+            host = _IMAGE_HOST_RE.search(url)
+            if host and host.group('reddit'):
+                has_image = True
+                reason = "Reddit hosted"
+            elif host and not host.group('album'):
+                has_image = True
+                reason = "Imgur direct"
 
         print(f"\n{name}:")
         print(f"  URL: {url}")
@@ -228,10 +239,11 @@ def test_image_url_extraction_logic():
     }
     post_with_preview = MockPost("https://example.com", preview=preview)
     print(f"  Preview URL (encoded): {preview['images'][0]['source']['url']}")
-    print(f"  Decoded: {preview['images'][0]['source']['url'].replace('&amp;', '&')}")
+    print(f"  Decoded: {unescape(preview['images'][0]['source']['url'])}")
 
 
 if __name__ == "__main__":
+    from src.utils import setup_logging
     setup_logging()
 
     # Run tests
@@ -0,0 +1,230 @@
+"""Offline checks of the Discord notifier's rate limiting and batching (no network access)"""
+
+import sys
+import os
+import time
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from src.notifiers.discord_notifier import DiscordNotifier
+from test_discord_forum_integration import OfflineWebhookAdapter
+
+# Webhook served by the offline adapter (never contacted)
+WEBHOOK_URL = "https://discord.com/api/webhooks/0000000000/offline-test"
+os.environ["DISCORD_OFFLINE_TEST_WEBHOOK"] = WEBHOOK_URL
+
+
+def make_notifier(adapter: OfflineWebhookAdapter, **config) -> DiscordNotifier:
+    """Build a notifier whose discord.com requests are answered by the adapter"""
+    notifier = DiscordNotifier({"webhook_env": "DISCORD_OFFLINE_TEST_WEBHOOK", **config})
+    notifier._session.mount("https://discord.com/", adapter)
+    return notifier
+
+
+def reset_rate_limits():
+    """Forget the rate limit state shared by all notifier instances"""
+    with DiscordNotifier._rate_lock:
+        DiscordNotifier._rate_limits.clear()
+        DiscordNotifier._url_buckets.clear()
+
+
+def test_next_available_after_send():
+    """next_available() is 0 after a 200 response that leaves requests in the bucket"""
+    reset_rate_limits()
+    adapter = OfflineWebhookAdapter()  # answers with X-RateLimit-Remaining: 5
+    with make_notifier(adapter, thread_name="Offline test") as notifier:
+        success, _ = notifier._send_message("rate limit check")
+        wait = notifier.next_available()
+
+    print(f"   sent={success}, next_available={wait}")
+    return success and len(adapter.requests) == 1 and wait == 0.0
+
+
+def test_bucket_shared_across_notifiers():
+    """A second notifier on the same webhook sees the bucket learned by the first"""
+    reset_rate_limits()
+    adapter = OfflineWebhookAdapter(responses=[
+        (200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "30",
+               "X-RateLimit-Bucket": "offline-bucket"}, {"id": "1"}),
+    ])
+    with make_notifier(adapter, thread_name="Offline test") as first:
+        success, _ = first._send_message("exhausts the bucket")
+
+    with make_notifier(OfflineWebhookAdapter()) as second:
+        wait = second.next_available()
+
+    print(f"   sent={success}, second notifier next_available={wait:.2f}s")
+    return (
+        success
+        and DiscordNotifier._url_buckets.get(WEBHOOK_URL) == "offline-bucket"
+        and 0 < wait <= 30
+    )
+
+
+def test_retry_once_on_429():
+    """A 429 is retried exactly once, after the advertised Retry-After delay"""
+    reset_rate_limits()
+    adapter = OfflineWebhookAdapter(responses=[
+        (429, {"Retry-After": "0.05"}, {"message": "You are being rate limited.", "retry_after": 0.05}),
+    ])
+    with make_notifier(adapter, thread_name="Offline test") as notifier:
+        start = time.monotonic()
+        success, _ = notifier._send_message("retried after 429")
+        elapsed = time.monotonic() - start
+
+    print(f"   sent={success}, requests={len(adapter.requests)}, elapsed={elapsed:.3f}s")
+    return success and len(adapter.requests) == 2 and elapsed >= 0.05
+
+
+def test_exhausted_bucket_waits():
+    """Remaining: 0 is recorded in the bucket and the next send waits for its reset"""
+    reset_rate_limits()
+    adapter = OfflineWebhookAdapter(responses=[
+        (200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset-After": "0.2"}, {"id": "1"}),
+    ])
+    with make_notifier(adapter, thread_name="Offline test") as notifier:
+        first, _ = notifier._send_message("exhausts the bucket")
+        remaining, _ = DiscordNotifier._rate_limits[WEBHOOK_URL]
+        wait = notifier.next_available()
+
+        start = time.monotonic()
+        second, _ = notifier._send_message("waits for the reset")
+        elapsed = time.monotonic() - start
+
+    print(f"   remaining={remaining}, recorded wait={wait:.3f}s, second send took {elapsed:.3f}s")
+    return first and second and remaining == 0 and 0 < wait <= 0.2 and elapsed >= wait - 0.05
+
+
+def test_missing_headers_fallback():
+    """Without rate limit headers the bucket falls back to a MESSAGE_DELAY pause"""
+    reset_rate_limits()
+    adapter = OfflineWebhookAdapter(responses=[(204, {}, None)])
+    with make_notifier(adapter, thread_name="Offline test") as notifier:
+        notifier.MESSAGE_DELAY = 0.1
+        success, _ = notifier._send_message("no headers")
+        remaining, _ = DiscordNotifier._rate_limits[WEBHOOK_URL]
+        wait = notifier.next_available()
+
+    print(f"   sent={success}, remaining={remaining}, wait={wait:.3f}s")
+    return success and remaining == 0 and 0 < wait <= 0.1
+
+
+def make_item(index: int, category: str = "Tools", insights: str = "Short insight", author: str = "") -> dict:
+    """Build an analyzed content item for embed batching checks"""
+    return {
+        "title": f"Item {index}",
+        "category": category,
+        "insights": insights,
+        "relevance_score": 7,
+        "metadata": {"source": "reddit", "author": author},
+    }
+
+
+def batch_categories(batch: list) -> list:
+    """Read back the category tag at the top of each embed description"""
+    return [embed["description"].split("**")[1].replace("📁 ", "") for embed in batch]
+
+
+def test_batches_capped_at_ten_embeds():
+    """Small embeds are packed ten per message"""
+    notifier = DiscordNotifier({"webhook_env": "DISCORD_OFFLINE_TEST_WEBHOOK"})
+    batches = notifier._build_embed_batches([make_item(i) for i in range(23)])
+    sizes = [len(batch) for batch in batches]
+
+    print(f"   batch sizes: {sizes}")
+    return sizes == [10, 10, 3]
+
+
+def test_batches_capped_at_total_chars():
+    """Embeds are split before a message exceeds MAX_EMBED_TOTAL_CHARS, oversize embeds travel alone"""
+    notifier = DiscordNotifier({"webhook_env": "DISCORD_OFFLINE_TEST_WEBHOOK"})
+    limit = notifier.MAX_EMBED_TOTAL_CHARS
+    items = [make_item(i, insights="x" * 2500) for i in range(5)]
+    items.insert(2, make_item(99, author="a" * (limit + 100)))
+
+    batches = notifier._build_embed_batches(items)
+    totals = [sum(notifier._embed_char_count(embed) for embed in batch) for batch in batches]
+    oversize = [batch for batch in batches if any(embed["title"] == "Item 99" for embed in batch)]
+
+    print(f"   batch sizes: {[len(batch) for batch in batches]}, totals: {totals}")
+    return (
+        sum(len(batch) for batch in batches) == len(items)
+        and all(total <= limit for batch, total in zip(batches, totals) if len(batch) > 1)
+        and len(oversize) == 1 and len(oversize[0]) == 1
+    )
+
+
+def test_batches_keep_category_order():
+    """Categories stay grouped and in first-seen order across batch boundaries"""
+    notifier = DiscordNotifier({"webhook_env": "DISCORD_OFFLINE_TEST_WEBHOOK"})
+    items = []
+    for i in range(8):
+        items.append(make_item(i, category="Research"))
+        items.append(make_item(i + 100, category="Tools"))
+    items.append(make_item(200, category="News"))
+
+    batches = notifier._build_embed_batches(items)
+    categories = [category for batch in batches for category in batch_categories(batch)]
+
+    print(f"   batch sizes: {[len(batch) for batch in batches]}")
+    return categories == ["Research"] * 8 + ["Tools"] * 8 + ["News"]
+
+
+def test_parallel_sends_post_each_batch_once():
+    """parallel_sends posts every batch exactly once to the forum thread"""
+    reset_rate_limits()
+    adapter = OfflineWebhookAdapter()
+    items = [make_item(i, category=("Research", "Tools", "News")[i % 3]) for i in range(35)]
+    with make_notifier(adapter, thread_name="Offline test", parallel_sends=True) as notifier:
+        batch_count = len(notifier._build_embed_batches(items))
+        success = notifier.send_rich_report(items)
+
+    header, *embed_posts, footer = adapter.requests
+    titles = [embed["title"] for _, payload in embed_posts for embed in payload["embeds"]]
+
+    print(f"   sent={success}, batches={batch_count}, embed posts={len(embed_posts)}, embeds={len(titles)}")
+    return (
+        success
+        and batch_count > 1
+        and "thread_name" in header[1] and "content" in header[1]
+        and len(embed_posts) == batch_count
+        and all("embeds" in payload and "thread_id=" in url for url, payload in embed_posts)
+        and sorted(titles) == sorted(item["title"] for item in items)
+        and "thread_id=" in footer[0] and "content" in footer[1]
+    )
+
+
+TESTS = [
+    ("next_available() after a send", test_next_available_after_send),
+    ("Bucket shared across notifiers", test_bucket_shared_across_notifiers),
+    ("Single retry on HTTP 429", test_retry_once_on_429),
+    ("Exhausted bucket waits for reset", test_exhausted_bucket_waits),
+    ("Missing headers fall back to MESSAGE_DELAY", test_missing_headers_fallback),
+    ("Batches capped at 10 embeds", test_batches_capped_at_ten_embeds),
+    ("Batches capped at 6000 embed characters", test_batches_capped_at_total_chars),
+    ("Category order kept across batches", test_batches_keep_category_order),
+    ("Parallel sends post each batch once", test_parallel_sends_post_each_batch_once),
+]
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("DISCORD NOTIFIER OFFLINE TESTS")
+    print("=" * 70)
+
+    results = []
+    for name, test in TESTS:
+        print(f"\n=== {name} ===")
+        results.append((name, test()))
+
+    print("\n" + "=" * 70)
+    print("SUMMARY")
+    print("=" * 70)
+    for test_name, success in results:
+        print(f"{'PASS' if success else 'FAIL'} - {test_name}")
+
+    passed = sum(1 for _, success in results if success)
+    print(f"\nTotal: {passed}/{len(results)} tests passed")
+    sys.exit(0 if passed == len(results) else 1)
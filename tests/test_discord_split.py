@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Test script to verify Discord message splitting with the latest report"""
 
+import mmap
 import os
+import re
 import sys
 from dotenv import load_dotenv
 
@@ -13,29 +15,40 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.notifiers.discord_notifier import DiscordNotifier
 
+# Report metric patterns (compiled once)
+_RE_TOTAL = re.compile(r'\*\*Total de contenus analysés\*\*:\s*(\d+)')
+_RE_REL = re.compile(r'\*\*Contenus pertinents\*\*:\s*(\d+)\s*\((\d+\.?\d*)%\)')
+_RE_SCORE = re.compile(r'\*\*Score de pertinence moyen\*\*:\s*(\d+\.?\d*)/10')
+_RE_SOURCES = re.compile(r'\*\*Sources\*\*:\s*\n(.*?)(?=\n\n|\n---)', re.DOTALL)
+_RE_SRC_ITEM = re.compile(r'-\s*(\w+):\s*(\d+)')
+_RE_CATS = re.compile(r'\*\*Distribution par catégorie\*\*:\s*\n(.*?)(?=\*\*Sources\*\*)', re.DOTALL)
+_RE_CAT_ITEM = re.compile(r'-\s*(.+?):\s*(\d+)')
+
 
 def extract_executive_summary(report_path: str) -> str:
     """Extract the executive summary from a report file"""
-    with open(report_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    start_marker = "## 📊 Résumé Exécutif".encode('utf-8')
 
-    # Find executive summary section
-    start_marker = "## 📊 Résumé Exécutif"
+    # Search the raw bytes via mmap and only decode the summary slice
+    with open(report_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return "No executive summary found"
 
-    start_idx = content.find(start_marker)
-    if start_idx == -1:
-        return "No executive summary found"
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            start_idx = m.find(start_marker)
+            if start_idx == -1:
+                return "No executive summary found"
 
-    # Move past the marker and any newlines
-    content_start = start_idx + len(start_marker)
+            # Move past the marker and any newlines
+            content_start = start_idx + len(start_marker)
 
-    # Find the next section (starts with ---)
-    next_section = content.find("\n---", content_start)
-    if next_section == -1:
-        return "No executive summary found"
+            # Find the next section (starts with ---)
+            next_section = m.find(b"\n---", content_start)
+            if next_section == -1:
+                return "No executive summary found"
 
-    # Extract the summary text
-    summary_section = content[content_start:next_section].strip()
+            # Extract the summary text
+            summary_section = m[content_start:next_section].decode('utf-8').strip()
 
     # If wrapped in ```markdown block, extract just the content
     if summary_section.startswith("```markdown"):
@@ -46,10 +59,31 @@ def extract_executive_summary(report_path: str) -> str:
     return summary_section
 
 
+def _read_metrics_header(report_path: str, chunk_size: int = 65536) -> str:
+    """
+    Read the report only up to the end of the metrics block.
+
+    Metrics end with the "**Sources**" list, so reading stops at the first
+    separator following it (or at EOF for reports without one).
+    """
+    content = ''
+    with open(report_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            content += chunk
+
+            sources_idx = content.find('**Sources**')
+            if sources_idx != -1 and content.find('\n---\n', sources_idx) != -1:
+                break
+
+    return content
+
+
 def extract_metrics(report_path: str) -> dict:
     """Extract metrics from a report file"""
-    with open(report_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    content = _read_metrics_header(report_path)
 
     metrics = {
         'total_analyzed': 0,
@@ -61,32 +95,30 @@ def extract_metrics(report_path: str) -> dict:
     }
 
     # Parse basic metrics
-    import re
-
-    total_match = re.search(r'\*\*Total de contenus analysés\*\*:\s*(\d+)', content)
+    total_match = _RE_TOTAL.search(content)
     if total_match:
         metrics['total_analyzed'] = int(total_match.group(1))
 
-    relevant_match = re.search(r'\*\*Contenus pertinents\*\*:\s*(\d+)\s*\((\d+\.?\d*)%\)', content)
+    relevant_match = _RE_REL.search(content)
     if relevant_match:
         metrics['relevant_count'] = int(relevant_match.group(1))
         metrics['relevant_percentage'] = float(relevant_match.group(2))
 
-    score_match = re.search(r'\*\*Score de pertinence moyen\*\*:\s*(\d+\.?\d*)/10', content)
+    score_match = _RE_SCORE.search(content)
     if score_match:
         metrics['average_score'] = float(score_match.group(1))
 
     # Parse sources
-    sources_section = re.search(r'\*\*Sources\*\*:\s*\n(.*?)(?=\n\n|\n---)', content, re.DOTALL)
+    sources_section = _RE_SOURCES.search(content)
     if sources_section:
-        source_matches = re.findall(r'-\s*(\w+):\s*(\d+)', sources_section.group(1))
+        source_matches = _RE_SRC_ITEM.findall(sources_section.group(1))
         for source, count in source_matches:
             metrics['by_source'][source.lower()] = int(count)
 
     # Parse categories
-    categories_section = re.search(r'\*\*Distribution par catégorie\*\*:\s*\n(.*?)(?=\*\*Sources\*\*)', content, re.DOTALL)
+    categories_section = _RE_CATS.search(content)
     if categories_section:
-        cat_matches = re.findall(r'-\s*(.+?):\s*(\d+)', categories_section.group(1))
+        cat_matches = _RE_CAT_ITEM.findall(categories_section.group(1))
         for cat, count in cat_matches:
             metrics['categories_distribution'][cat.strip()] = int(count)
 
@@ -99,55 +131,50 @@ def main():
     print("=" * 60)
 
     # Initialize notifier
-    notifier = DiscordNotifier()
+    with DiscordNotifier() as notifier:
+        if not notifier.webhook_url:
+            print("ERROR: DISCORD_WEBHOOK_URL not configured in .env")
+            print("Please set DISCORD_WEBHOOK_URL in your .env file")
+            return
 
-    if not notifier.webhook_url:
-        print("ERROR: DISCORD_WEBHOOK_URL not configured in .env")
-        print("Please set DISCORD_WEBHOOK_URL in your .env file")
-        return
+        # Load the latest report
+        report_path = "data/reports/veille_ia_2025-11-16.md"
 
-    # Load the latest report
-    report_path = "data/reports/veille_ia_2025-11-16.md"
+        if not os.path.exists(report_path):
+            print(f"ERROR: Report not found at {report_path}")
+            return
 
-    if not os.path.exists(report_path):
-        print(f"ERROR: Report not found at {report_path}")
-        return
+        print(f"Loading report: {report_path}")
 
-    print(f"Loading report: {report_path}")
+        # Read the full report once (reused for sending below)
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report_content = f.read()
 
-    # Read the full report
-    with open(report_path, 'r', encoding='utf-8') as f:
-        report_content = f.read()
+        # Clean the content
+        cleaned_content = notifier._clean_markdown_for_discord(report_content)
 
-    # Clean the content
-    cleaned_content = notifier._clean_markdown_for_discord(report_content)
+        print(f"\nFull report length: {len(report_content)} characters")
+        print(f"Cleaned report length: {len(cleaned_content)} characters")
 
-    print(f"\nFull report length: {len(report_content)} characters")
-    print(f"Cleaned report length: {len(cleaned_content)} characters")
+        # Test the splitting
+        chunks = notifier._split_message(cleaned_content)
+        print(f"\nReport will be split into {len(chunks)} part(s)")
 
-    # Test the splitting
-    chunks = notifier._split_message(cleaned_content)
-    print(f"\nReport will be split into {len(chunks)} part(s)")
+        sizes = [len(chunk) for chunk in chunks]
+        sys.stdout.write("".join(f"Part {i}: {size} characters\n" for i, size in enumerate(sizes, 1)))
 
-    for i, chunk in enumerate(chunks, 1):
-        print(f"Part {i}: {len(chunk)} characters")
-
-    # Estimate time
-    total_time = len(chunks) * notifier.MESSAGE_DELAY
-    print(f"\nEstimated sending time: {total_time:.1f} seconds")
-
-    # Send automatically
-    print("\n" + "=" * 60)
-    print("Sending full report to Discord...")
-    print("This may take a while due to rate limiting delays...")
-    print("=" * 60)
+        # Send automatically
+        print("\n" + "=" * 60)
+        print("Sending full report to Discord...")
+        print("Parts are paced by Discord's rate limit headers")
+        print("=" * 60)
 
-    success = notifier.send_full_report(report_path=report_path, mention_role="")
+        success = notifier.send_full_report(report_content=report_content, mention_role="")
 
-    if success:
-        print("\nSUCCESS! Full report sent to Discord.")
-    else:
-        print("\nFAILED to send full report to Discord.")
+        if success:
+            print("\nSUCCESS! Full report sent to Discord.")
+        else:
+            print("\nFAILED to send full report to Discord.")
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 """Test script to verify package display names in reports and notifications"""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from typing import List, Tuple
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -12,6 +15,87 @@ from src.notifiers.synology_notifier import SynologyNotifier
 from src.storage.report_generator import ReportGenerator
 
 
+def check_package(pkg) -> Tuple[bool, List[str]]:
+    """
+    Check one package's display name in all components
+
+    Args:
+        pkg: Loaded package configuration
+
+    Returns:
+        (passed, output lines) - output is collected so packages can run concurrently
+    """
+    passed = True
+    lines = []
+
+    lines.append(f"\n{'-' * 60}")
+    lines.append(f"Testing package: {pkg.name}")
+    lines.append(f"Display name: {pkg.display_name}")
+    lines.append(f"{'-' * 60}")
+
+    # Every header shows the display name upper-cased
+    upper_name = pkg.display_name.upper()
+
+    # Test Discord Notifier
+    lines.append("\n1. Discord Notifier")
+    discord_config = pkg.settings.get('discord', {})
+    with DiscordNotifier(
+        config=discord_config,
+        package_display_name=pkg.display_name
+    ) as discord_notifier:
+        # Create a test header
+        test_header = discord_notifier._create_header_message(total_insights=5)
+    if upper_name in test_header:
+        lines.append(f"   [OK] Discord header contains correct display name")
+        lines.append(f"   Preview: {test_header[:80]}...")
+    else:
+        lines.append(f"   [FAIL] Discord header missing display name")
+        lines.append(f"   Got: {test_header[:100]}")
+        passed = False
+
+    # Test Synology Notifier
+    lines.append("\n2. Synology Notifier")
+    synology_config = pkg.settings.get('synology', {})
+    with SynologyNotifier(
+        config=synology_config,
+        package_display_name=pkg.display_name
+    ) as synology_notifier:
+        test_header = synology_notifier._create_header_message(total_insights=5)
+    if upper_name in test_header:
+        lines.append(f"   [OK] Synology header contains correct display name")
+        lines.append(f"   Preview: {test_header[:80]}...")
+    else:
+        lines.append(f"   [FAIL] Synology header missing display name")
+        lines.append(f"   Got: {test_header[:100]}")
+        passed = False
+
+    # Test Report Generator
+    lines.append("\n3. Report Generator")
+    report_generator = ReportGenerator(
+        package_name=pkg.name,
+        config=pkg.settings,
+        prompts=pkg.prompts,
+        ollama_config=pkg.get_ollama_config(),
+        package_display_name=pkg.display_name
+    )
+
+    # Create a test report with minimal data
+    test_report = report_generator._build_markdown(
+        by_category={"Test Category": []},
+        statistics=None,
+        report_date=datetime.now()
+    )
+
+    if upper_name in test_report:
+        lines.append(f"   [OK] Report header contains correct display name")
+        # Skip preview to avoid emoji encoding issues on Windows
+    else:
+        lines.append(f"   [FAIL] Report header missing display name")
+        passed = False
+
+    return passed, lines
+
+
 def test_package_display_names():
     """Test that package display names are correctly used in all components"""
 
@@ -29,74 +113,18 @@ def test_package_display_names():
 
     print(f"\nFound {len(package_names)} package(s):")
 
-    # Test each package
-    all_passed = True
-    for pkg_name in package_names:
-        pkg = pm.load_package(pkg_name)
-        print(f"  - {pkg_name}: '{pkg.display_name}'")
-        print(f"\n{'-' * 60}")
-        print(f"Testing package: {pkg_name}")
-        print(f"Display name: {pkg.display_name}")
-        print(f"{'-' * 60}")
-
-        # Test Discord Notifier
-        print("\n1. Discord Notifier")
-        discord_config = pkg.settings.get('discord', {})
-        discord_notifier = DiscordNotifier(
-            config=discord_config,
-            package_display_name=pkg.display_name
-        )
+    packages = [pm.load_package(pkg_name) for pkg_name in package_names]
+    for pkg in packages:
+        print(f"  - {pkg.name}: '{pkg.display_name}'")
 
-        # Create a test header
-        test_header = discord_notifier._create_header_message(total_insights=5)
-        if pkg.display_name.upper() in test_header:
-            print(f"   [OK] Discord header contains correct display name")
-            print(f"   Preview: {test_header[:80]}...")
-        else:
-            print(f"   [FAIL] Discord header missing display name")
-            print(f"   Got: {test_header[:100]}")
-            all_passed = False
-
-        # Test Synology Notifier
-        print("\n2. Synology Notifier")
-        synology_config = pkg.settings.get('synology', {})
-        synology_notifier = SynologyNotifier(
-            config=synology_config,
-            package_display_name=pkg.display_name
-        )
-
-        test_header = synology_notifier._create_header_message(total_insights=5)
-        if pkg.display_name.upper() in test_header:
-            print(f"   [OK] Synology header contains correct display name")
-            print(f"   Preview: {test_header[:80]}...")
-        else:
-            print(f"   [FAIL] Synology header missing display name")
-            print(f"   Got: {test_header[:100]}")
-            all_passed = False
+    # Test each package: packages are independent, so check them in parallel and print in order
+    all_passed = True
+    with ThreadPoolExecutor(max_workers=min(8, len(packages))) as executor:
+        results = list(executor.map(check_package, packages))
 
-        # Test Report Generator
-        print("\n3. Report Generator")
-        report_generator = ReportGenerator(
-            package_name=pkg.name,
-            config=pkg.settings,
-            prompts=pkg.prompts,
-            ollama_config=pkg.get_ollama_config(),
-            package_display_name=pkg.display_name
-        )
-
-        # Create a test report with minimal data
-        from datetime import datetime
-        test_report = report_generator._build_markdown(
-            by_category={"Test Category": []},
-            statistics=None,
-            report_date=datetime.now()
-        )
-
-        if pkg.display_name.upper() in test_report:
-            print(f"   [OK] Report header contains correct display name")
-            # Skip preview to avoid emoji encoding issues on Windows
-        else:
-            print(f"   [FAIL] Report header missing display name")
+    for passed, lines in results:
+        print("\n".join(lines))
+        if not passed:
             all_passed = False
 
     print(f"\n{'=' * 60}")
@@ -2,6 +2,8 @@
 
 import sys
 import io
+import contextlib
+from operator import itemgetter
 from pathlib import Path
 
 # Fix Windows console encoding
@@ -15,6 +17,10 @@ sys.path.append(str(Path(__file__).parent.parent))
 from src.notifiers.fallback_manager import FallbackManager
 from src.utils import setup_package_logging
 
+# Fields every parsed item must carry for the notifiers
+_REQUIRED_FIELDS = frozenset(('title', 'category', 'metadata'))
+_SUMMARY_FIELDS = itemgetter('title', 'category', 'metadata')
+
 
 def test_parse_report():
     """Test parsing an existing report"""
@@ -22,9 +28,6 @@ def test_parse_report():
     print("TEST: Parse Report")
     print("=" * 60)
 
-    # Setup logging
-    setup_package_logging("test_fallback")
-
     # Initialize fallback manager
     manager = FallbackManager("ai_trends")
 
@@ -49,24 +52,28 @@ def test_parse_report():
     print("Sample parsed items:")
     print("-" * 60)
 
+    lines = []
     for i, item in enumerate(items[:3], 1):  # Show first 3
-        print(f"\n{i}. {item['title'][:60]}...")
-        print(f"   Category: {item['category']}")
-        print(f"   Score: {item['relevance_score']}/10")
-        print(f"   Has hook: {bool(item.get('hook'))}")
-        print(f"   Insights length: {len(item.get('insights', ''))} chars")
-        print(f"   Metadata keys: {', '.join(item['metadata'].keys())}")
+        title, category, metadata = _SUMMARY_FIELDS(item)
+        lines.append(f"\n{i}. {title[:60]}...")
+        lines.append(f"   Category: {category}")
+        lines.append(f"   Score: {item['relevance_score']}/10")
+        lines.append(f"   Has hook: {bool(item.get('hook'))}")
+        lines.append(f"   Insights length: {len(item.get('insights', ''))} chars")
+        lines.append(f"   Metadata keys: {', '.join(metadata.keys())}")
 
         # Show metadata details
-        metadata = item['metadata']
         if metadata.get('source'):
-            print(f"   Source: {metadata['source']}")
+            lines.append(f"   Source: {metadata['source']}")
         if metadata.get('url'):
-            print(f"   URL: {metadata['url'][:50]}...")
+            lines.append(f"   URL: {metadata['url'][:50]}...")
         if metadata.get('video_id'):
-            print(f"   Video ID: {metadata['video_id']}")
+            lines.append(f"   Video ID: {metadata['video_id']}")
         if metadata.get('image_url'):
-            print(f"   Image URL: {metadata['image_url'][:50]}...")
+            lines.append(f"   Image URL: {metadata['image_url'][:50]}...")
+
+    # One write for the whole sample
+    print("\n".join(lines))
 
     print("\n" + "=" * 60)
     print(f"✓ TEST PASSED - Parsed {len(items)} items successfully")
@@ -81,9 +88,6 @@ def test_fallback_simulation():
     print("TEST: Fallback Simulation")
     print("=" * 60)
 
-    # Setup logging
-    setup_package_logging("test_fallback")
-
     # Initialize fallback manager
     manager = FallbackManager("ai_trends", max_retries=2, retry_delay=1.0)
 
@@ -112,7 +116,7 @@ def test_fallback_simulation():
 
     print("\n✓ Simulation complete")
     print("\nParsed data structure is compatible with notifiers:")
-    print(f"  - Items have all required fields: {all(k in items[0] for k in ['title', 'category', 'metadata'])}")
+    print(f"  - Items have all required fields: {_REQUIRED_FIELDS <= items[0].keys()}")
     print(f"  - Metadata has source info: {'source' in items[0]['metadata']}")
 
     print("\n" + "=" * 60)
@@ -122,12 +126,31 @@ def test_fallback_simulation():
     return True
 
 
+def run_buffered(func):
+    """
+    Run a test with its output collected in memory and written in one go.
+
+    Returns:
+        The test's result
+    """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return func()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 60)
     print("FALLBACK MECHANISM TESTS")
     print("=" * 60 + "\n")
 
+    # Setup logging once for all tests
+    setup_package_logging("test_fallback")
+
     tests = [
         ("Parse Report", test_parse_report),
         ("Fallback Simulation", test_fallback_simulation),
@@ -136,7 +159,7 @@ def main():
     results = []
     for test_name, test_func in tests:
         try:
-            result = test_func()
+            result = run_buffered(test_func)
             results.append((test_name, result))
         except Exception as e:
             print(f"\n❌ TEST FAILED: {test_name}")
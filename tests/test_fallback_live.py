@@ -2,6 +2,7 @@
 
 import sys
 import io
+import contextlib
 from pathlib import Path
 
 # Fix Windows console encoding
@@ -19,6 +20,17 @@ from src.utils import setup_package_logging, load_env_variables
 from src.package_manager import PackageManager
 
 
+_PACKAGE = None
+
+
+def get_package():
+    """Load the ai_trends package once and share it across tests (configs don't change mid-run)"""
+    global _PACKAGE
+    if _PACKAGE is None:
+        _PACKAGE = PackageManager().load_package("ai_trends")
+    return _PACKAGE
+
+
 def test_discord_fallback():
     """Test fallback mechanism with Discord notifier"""
     print("=" * 60)
@@ -30,8 +42,7 @@ def test_discord_fallback():
     load_env_variables()
 
     # Load package config
-    pm = PackageManager()
-    pkg = pm.load_package("ai_trends")
+    pkg = get_package()
 
     # Initialize fallback manager
     fallback_config = pkg.settings.get('fallback', {})
@@ -51,34 +62,33 @@ def test_discord_fallback():
 
     # Initialize Discord notifier
     discord_config = pkg.settings.get('discord', {})
-    discord_notifier = DiscordNotifier(config=discord_config)
-
-    if not discord_notifier.webhook_url:
-        print("⚠️  Discord webhook not configured, skipping Discord test")
-        return None
-
-    # Check if rich embeds enabled
-    use_rich_embeds = discord_config.get('rich_embeds', True)
-    send_method = 'send_rich_report' if use_rich_embeds else 'send_full_report'
-
-    print(f"\n📤 Sending via fallback mechanism...")
-    print(f"   Method: {send_method}")
-    print(f"   Rich embeds: {use_rich_embeds}")
-
-    # Trigger fallback (simulates a failed original send)
-    success = fallback_manager.retry_with_fallback(
-        notifier=discord_notifier,
-        send_method=send_method,
-        report_path=latest_report,
-        mention_role=discord_config.get('mention_role', '')
-    )
-
-    if success:
-        print("\n✓ Discord fallback succeeded!")
-        return True
-    else:
-        print("\n❌ Discord fallback failed")
-        return False
+    with DiscordNotifier(config=discord_config) as discord_notifier:
+        if not discord_notifier.webhook_url:
+            print("⚠️  Discord webhook not configured, skipping Discord test")
+            return None
+
+        # Check if rich embeds enabled
+        use_rich_embeds = discord_config.get('rich_embeds', True)
+        send_method = 'send_rich_report' if use_rich_embeds else 'send_full_report'
+
+        print(f"\n📤 Sending via fallback mechanism...")
+        print(f"   Method: {send_method}")
+        print(f"   Rich embeds: {use_rich_embeds}")
+
+        # Trigger fallback (simulates a failed original send)
+        success = fallback_manager.retry_with_fallback(
+            notifier=discord_notifier,
+            send_method=send_method,
+            report_path=latest_report,
+            mention_role=discord_config.get('mention_role', '')
+        )
+
+        if success:
+            print("\n✓ Discord fallback succeeded!")
+            return True
+        else:
+            print("\n❌ Discord fallback failed")
+            return False
 
 
 def test_synology_fallback():
@@ -92,8 +102,7 @@ def test_synology_fallback():
     load_env_variables()
 
     # Load package config
-    pm = PackageManager()
-    pkg = pm.load_package("ai_trends")
+    pkg = get_package()
 
     # Initialize fallback manager
     fallback_config = pkg.settings.get('fallback', {})
@@ -113,32 +122,47 @@ def test_synology_fallback():
 
     # Initialize Synology notifier
     synology_config = pkg.settings.get('synology', {})
-    synology_notifier = SynologyNotifier(
+    with SynologyNotifier(
         config=synology_config,
         package_display_name=pkg.display_name
-    )
-
-    if not synology_notifier.webhook_url:
-        print("⚠️  Synology webhook not configured, skipping Synology test")
-        return None
+    ) as synology_notifier:
+        if not synology_notifier.webhook_url:
+            print("⚠️  Synology webhook not configured, skipping Synology test")
+            return None
+
+        print(f"\n📤 Sending via fallback mechanism...")
+        print(f"   Method: send_rich_report")
+
+        # Trigger fallback (simulates a failed original send)
+        success = fallback_manager.retry_with_fallback(
+            notifier=synology_notifier,
+            send_method='send_rich_report',
+            report_path=latest_report,
+            mention=synology_config.get('mention', '')
+        )
+
+        if success:
+            print("\n✓ Synology fallback succeeded!")
+            return True
+        else:
+            print("\n❌ Synology fallback failed")
+            return False
 
-    print(f"\n📤 Sending via fallback mechanism...")
-    print(f"   Method: send_rich_report")
 
-    # Trigger fallback (simulates a failed original send)
-    success = fallback_manager.retry_with_fallback(
-        notifier=synology_notifier,
-        send_method='send_rich_report',
-        report_path=latest_report,
-        mention=synology_config.get('mention', '')
-    )
+def run_buffered(func):
+    """
+    Run a test with its output collected in memory and written in one go.
 
-    if success:
-        print("\n✓ Synology fallback succeeded!")
-        return True
-    else:
-        print("\n❌ Synology fallback failed")
-        return False
+    Returns:
+        The test's result
+    """
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            return func()
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
 
 
 def main():
@@ -158,7 +182,7 @@ def main():
     results = []
     for test_name, test_func in tests:
         try:
-            result = test_func()
+            result = run_buffered(test_func)
             results.append((test_name, result))
         except Exception as e:
             print(f"\n❌ TEST FAILED: {test_name}")
@@ -4,17 +4,42 @@ Test script for fast similarity detection using real raw data from SCRIBE.
 This script parses the raw logs and tests duplicate detection on actual Reddit posts.
 """
 
+import os
 import sys
 import re
+import mmap
 import time
+import random
+import pickle
+import hashlib
 import logging
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import combinations
 from pathlib import Path
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.processors.fast_similarity import FastSimilarityDetector
+from src.processors.fast_similarity import FastSimilarityDetector, TFIDF_PARAMS
 from src.processors.deduplicator import ContentDeduplicator
+from buffered_output import ThreadBufferedStdout
+
+# Raw log patterns (compiled once)
+_ITEM_SPLIT_RE = re.compile(rb'\r?\n## Item \d+\r?\n')
+_TITLE_RE = re.compile(r'^### (.+?)$', re.MULTILINE)
+# All metadata fields in one alternation, so each item is scanned once
+_META_RE = re.compile(
+    r'\*\*(?:ID:\*\* (?P<id>\w+)'
+    r'|Subreddit:\*\* r/(?P<subreddit>\w+)'
+    r'|Author:\*\* u/(?P<author>\w+)'
+    r'|Score:\*\* (?P<score>\d+)'
+    r'|URL:\*\* (?P<url>https?://[^\s]+))'
+)
+_META_FIELDS = ('id', 'subreddit', 'author', 'score', 'url')
+_CONTENT_RE = re.compile(r'#### Post Content\n\n```\n(.*?)\n```', re.DOTALL)
+_COMMENTS_RE = re.compile(r'\*\*Comment \d+\*\*.*?\n```\n(.*?)\n```', re.DOTALL)
 
 
 def parse_reddit_raw_log(file_path: str) -> list:
@@ -27,67 +52,121 @@ def parse_reddit_raw_log(file_path: str) -> list:
     Returns:
         List of article dictionaries with title, content, id, etc.
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
     articles = []
 
-    # Split by "## Item" to get each article
-    items = re.split(r'\n## Item \d+\n', content)
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return articles
 
-    for item in items[1:]:  # Skip header
-        article = {}
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for item in _iter_items(mm):
+                article = _parse_item(item)
+                if article:
+                    articles.append(article)
 
-        # Extract title (first ### line)
-        title_match = re.search(r'^### (.+?)$', item, re.MULTILINE)
-        if title_match:
-            article['title'] = title_match.group(1).strip()
-        else:
-            continue
+    return articles
 
-        # Extract ID
-        id_match = re.search(r'\*\*ID:\*\* (\w+)', item)
-        if id_match:
-            article['id'] = id_match.group(1)
-
-        # Extract subreddit
-        sub_match = re.search(r'\*\*Subreddit:\*\* r/(\w+)', item)
-        if sub_match:
-            article['subreddit'] = sub_match.group(1)
-
-        # Extract author
-        author_match = re.search(r'\*\*Author:\*\* u/(\w+)', item)
-        if author_match:
-            article['author'] = author_match.group(1)
-
-        # Extract score
-        score_match = re.search(r'\*\*Score:\*\* (\d+)', item)
-        if score_match:
-            article['score'] = int(score_match.group(1))
-
-        # Extract URL
-        url_match = re.search(r'\*\*URL:\*\* (https?://[^\s]+)', item)
-        if url_match:
-            article['url'] = url_match.group(1)
-
-        # Extract post content (if any)
-        content_match = re.search(r'#### Post Content\n\n```\n(.*?)\n```', item, re.DOTALL)
-        if content_match:
-            article['content'] = content_match.group(1).strip()
-        else:
-            # Try to get top comments as content summary
-            comments = []
-            comment_matches = re.findall(r'\*\*Comment \d+\*\*.*?\n```\n(.*?)\n```', item, re.DOTALL)
-            for comment in comment_matches[:3]:  # Take first 3 comments
-                comments.append(comment.strip())
-            article['content'] = ' '.join(comments) if comments else ''
 
-        if article.get('title'):
-            articles.append(article)
+def _iter_items(mm):
+    """
+    Lazily yield decoded items (text between "## Item N" separators) of a raw log.
+
+    Args:
+        mm: Mapped (or bytes) raw log content
+
+    Yields:
+        Item text with normalized newlines
+    """
+    prev = None
+    for match in _ITEM_SPLIT_RE.finditer(mm):
+        if prev is not None:
+            yield _decode_item(mm[prev:match.start()])
+        prev = match.end()
+    if prev is not None:
+        yield _decode_item(mm[prev:])
+
+
+def _decode_item(raw: bytes) -> str:
+    """Decode an item, normalizing newlines as text-mode reading would (logs written on Windows)."""
+    return raw.decode('utf-8').replace('\r\n', '\n')
+
+
+def parse_reddit_raw_log_cached(file_path: str, cache_dir: str = "data/cache") -> list:
+    """
+    Parse a Reddit raw log, reusing a pickled result while the file is unchanged.
+
+    The cache key covers the resolved path, mtime and size of the log file.
+
+    Args:
+        file_path: Path to the markdown file
+        cache_dir: Directory for cached parse results
+
+    Returns:
+        List of article dictionaries (see parse_reddit_raw_log)
+    """
+    stat = os.stat(file_path)
+    key = hashlib.sha256(
+        f"{Path(file_path).resolve()}:{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8')
+    ).hexdigest()
+    cache_path = Path(cache_dir) / f"{key}.pkl"
+
+    if cache_path.exists():
+        try:
+            return pickle.loads(cache_path.read_bytes())
+        except (pickle.UnpicklingError, EOFError):
+            pass  # Corrupted cache entry, parse again
+
+    articles = parse_reddit_raw_log(file_path)
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(pickle.dumps(articles))
+    except OSError:
+        pass  # Caching is best effort
 
     return articles
 
 
+def _parse_item(item: str) -> dict:
+    """Parse a single raw log item (returns None when it has no title)."""
+    article = {}
+
+    # Extract title (first ### line)
+    title_match = _TITLE_RE.search(item) if '### ' in item else None
+    if title_match:
+        article['title'] = title_match.group(1).strip()
+    else:
+        return None
+
+    # Extract ID, subreddit, author, score and URL (first occurrence of each)
+    metadata = {}
+    for match in (_META_RE.finditer(item) if ':** ' in item else ()):
+        field = match.lastgroup
+        if field not in metadata:
+            metadata[field] = match.group(field)
+            if len(metadata) == len(_META_FIELDS):
+                break
+    if 'score' in metadata:
+        metadata['score'] = int(metadata['score'])
+    article.update(metadata)
+
+    # Extract post content (if any), skipping the regexes when the markers are absent
+    content_match = _CONTENT_RE.search(item) if '#### Post Content' in item else None
+    if content_match:
+        article['content'] = content_match.group(1).strip()
+    else:
+        # Try to get top comments as content summary
+        comments = []
+        if '**Comment ' in item:
+            for k, match in enumerate(_COMMENTS_RE.finditer(item)):
+                if k == 3:  # Take first 3 comments
+                    break
+                comments.append(match.group(1).strip())
+        article['content'] = ' '.join(comments) if comments else ''
+
+    return article if article.get('title') else None
+
+
 def convert_to_analyzed_format(articles: list) -> list:
     """
     Convert raw articles to the format expected by the deduplicator
@@ -120,7 +199,195 @@ def convert_to_analyzed_format(articles: list) -> list:
     return analyzed
 
 
-def test_pairwise_similarity(articles: list, detector: FastSimilarityDetector, threshold: float = 0.75):
+# MinHash-LSH parameters: 32 bands x 4 rows ~ Jaccard threshold (1/32)^(1/4) = 0.42
+_MINHASH_PERMUTATIONS = 128
+_LSH_BANDS = 32
+# Mersenne prime small enough for (a * h + b) to fit in 64-bit integers
+_MINHASH_PRIME = (1 << 31) - 1
+
+
+def _token_hash(token: str) -> int:
+    """Stable hash of a token, reduced modulo the MinHash prime."""
+    return int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little') % _MINHASH_PRIME
+
+
+def _minhash_signature(tokens: set, seeds: tuple) -> tuple:
+    """
+    Compute a MinHash signature of a token set (one min-hash per seed).
+
+    With NumPy all permutations are evaluated in one vectorized
+    (permutations x tokens) operation; the pure-Python path gives the same values.
+    """
+    multipliers, offsets = seeds
+    hashes = [_token_hash(token) for token in tokens]
+
+    try:
+        import numpy as np
+    except ImportError:
+        return tuple(
+            min((a * h + b) % _MINHASH_PRIME for h in hashes)
+            for a, b in zip(multipliers, offsets)
+        )
+
+    values = np.array(hashes, dtype=np.uint64)
+    a = np.array(multipliers, dtype=np.uint64)[:, None]
+    b = np.array(offsets, dtype=np.uint64)[:, None]
+    return tuple(((a * values[None, :] + b) % _MINHASH_PRIME).min(axis=1).tolist())
+
+
+def find_candidate_pairs(texts: list, detector: FastSimilarityDetector) -> list:
+    """
+    Find candidate near-duplicate pairs with MinHash LSH banding.
+
+    Only pairs sharing at least one LSH bucket are returned, so the expensive
+    similarity cascade runs on a small subset of the N(N-1)/2 pairs.
+
+    Args:
+        texts: Texts to index
+        detector: Detector whose tokenizer is used for shingling
+
+    Returns:
+        Sorted list of (i, j) index pairs with i < j
+    """
+    rng = random.Random(42)
+    seeds = (
+        [rng.randrange(1, _MINHASH_PRIME) for _ in range(_MINHASH_PERMUTATIONS)],
+        [rng.randrange(0, _MINHASH_PRIME) for _ in range(_MINHASH_PERMUTATIONS)],
+    )
+    rows = _MINHASH_PERMUTATIONS // _LSH_BANDS
+
+    buckets = defaultdict(list)
+    for idx, text in enumerate(texts):
+        tokens = set(detector._tokenize(text))
+        if not tokens:
+            continue
+        signature = _minhash_signature(tokens, seeds)
+        for band in range(_LSH_BANDS):
+            buckets[(band, signature[band * rows:(band + 1) * rows])].append(idx)
+
+    pairs = set()
+    for members in buckets.values():
+        pairs.update(combinations(members, 2))
+
+    return sorted(pairs)
+
+
+def find_simhash_pairs(texts: list, detector: FastSimilarityDetector, block_size: int = 512) -> list:
+    """
+    Find all pairs whose SimHash similarity reaches the detector's threshold.
+
+    Hamming distances are computed with NumPy (xor + popcount over row blocks)
+    when available, instead of one Python bin().count() per pair.
+
+    Returns:
+        List of (i, j) index pairs with i < j
+    """
+    hashes = [detector._compute_simhash(text) for text in texts]
+    n = len(hashes)
+    # similarity = 1 - distance / 64 >= threshold  <=>  distance <= (1 - threshold) * 64
+    max_distance = int((1 - detector.simhash_threshold) * 64 + 1e-9)
+
+    try:
+        import numpy as np
+    except ImportError:
+        return [
+            (i, j) for i in range(n) for j in range(i + 1, n)
+            if bin(hashes[i] ^ hashes[j]).count('1') <= max_distance
+        ]
+
+    values = np.array(hashes, dtype=np.uint64)
+    pairs = []
+    for start in range(0, n, block_size):
+        block = values[start:start + block_size]
+        xor = block[:, None] ^ values[None, :]
+        if hasattr(np, 'bitwise_count'):
+            distances = np.bitwise_count(xor)
+        else:
+            distances = np.unpackbits(xor.view(np.uint8).reshape(len(block), n, 8), axis=-1).sum(-1)
+        rows, cols = np.nonzero(distances <= max_distance)
+        rows += start
+        upper = rows < cols
+        pairs.extend(zip(rows[upper].tolist(), cols[upper].tolist()))
+
+    return pairs
+
+
+# Minimum SimHash bit similarity for a candidate pair to reach the full cascade
+_SIMHASH_GATE = 0.3
+
+# Pairwise scoring runs in worker processes above this many candidate pairs
+_PARALLEL_MIN_PAIRS = 2000
+_PAIR_CHUNK_SIZE = 256
+
+# Per-process state for pairwise scoring workers
+_worker_state = {}
+
+# Workers are spawned, never forked: the pool is started from a phase thread while
+# sibling phases run numpy/sklearn and sys.stdout is swapped for the buffering proxy
+_POOL_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def _score_pairs(detector: FastSimilarityDetector, texts: list, titles: list, pairs: list) -> list:
+    """Score index pairs, keeping only those with similarity >= 0.5."""
+    results = []
+    for i, j in pairs:
+        sim_score, method = detector.check_similarity(texts[i], texts[j], titles[i], titles[j])
+        if sim_score >= 0.5:
+            results.append((i, j, sim_score, method))
+    return results
+
+
+def _init_pairwise_worker(texts: list, titles: list, detector_params: dict):
+    """Process pool initializer: rebuild the detector once per worker."""
+    _worker_state['texts'] = texts
+    _worker_state['titles'] = titles
+    _worker_state['detector'] = FastSimilarityDetector(**detector_params)
+
+
+def _score_pair_chunk(pairs: list) -> list:
+    """Process pool task: score a chunk of pairs with the worker's detector."""
+    return _score_pairs(_worker_state['detector'], _worker_state['texts'], _worker_state['titles'], pairs)
+
+
+def score_pairs_parallel(detector: FastSimilarityDetector, texts: list, titles: list, pairs: list) -> list:
+    """
+    Score pairs across CPU cores (serially when there are too few to pay off).
+
+    Returns:
+        List of (i, j, score, method) tuples with score >= 0.5, in no particular order
+    """
+    if len(pairs) < _PARALLEL_MIN_PAIRS:
+        return _score_pairs(detector, texts, titles, pairs)
+
+    detector_params = {
+        'simhash_threshold': detector.simhash_threshold,
+        'tfidf_threshold': detector.tfidf_threshold,
+        'title_weight': detector.title_weight,
+        'use_embeddings': detector.use_embeddings,
+        'tfidf_vectorizer': detector._vectorizer
+    }
+    chunks = [pairs[k:k + _PAIR_CHUNK_SIZE] for k in range(0, len(pairs), _PAIR_CHUNK_SIZE)]
+
+    results = []
+    with ProcessPoolExecutor(mp_context=_POOL_CONTEXT, initializer=_init_pairwise_worker,
+                             initargs=(texts, titles, detector_params)) as executor:
+        for chunk_results in executor.map(_score_pair_chunk, chunks):
+            results.extend(chunk_results)
+    return results
+
+
+def build_comparison_texts(articles: list) -> list:
+    """
+    Build the "title + truncated content" texts compared by the pairwise tests.
+
+    Computed once in main() and shared by both pairwise phases.
+    """
+    # Limit content to 500 chars to simulate real insights
+    return [f"{art['title']}\n\n{art.get('content', '')[:500]}" for art in articles]
+
+
+def test_pairwise_similarity(articles: list, detector: FastSimilarityDetector, threshold: float = 0.75,
+                             texts: list = None):
     """
     Test pairwise similarity to find potential duplicates.
     """
@@ -130,49 +397,179 @@ def test_pairwise_similarity(articles: list, detector: FastSimilarityDetector, t
 
     high_similarity_pairs = []
 
-    for i in range(len(articles)):
-        for j in range(i + 1, len(articles)):
-            art1 = articles[i]
-            art2 = articles[j]
+    if texts is None:
+        texts = build_comparison_texts(articles)
+
+    # Only score pairs that share an LSH bucket, plus SimHash near-duplicates
+    # (which the cascade would flag even when their token sets differ)
+    candidate_pairs = sorted(set(find_candidate_pairs(texts, detector)) | set(find_simhash_pairs(texts, detector)))
+    total_pairs = len(articles) * (len(articles) - 1) // 2
+    print(f"\nLSH candidates: {len(candidate_pairs)} of {total_pairs} pairs")
+
+    # Coarse SimHash gate: pairs with very dissimilar fingerprints skip the cascade
+    hashes = [detector.simhash(text) for text in texts]
+    gated_pairs = [
+        (i, j) for i, j in candidate_pairs
+        if detector.cheap_hamming(hashes[i], hashes[j]) >= _SIMHASH_GATE
+    ]
+    pruned = len(candidate_pairs) - len(gated_pairs)
+    if candidate_pairs:
+        print(f"SimHash gate pruned {pruned} of {len(candidate_pairs)} candidates "
+              f"({pruned / len(candidate_pairs) * 100:.1f}%)")
+
+    # Specialize trivial pairs: identical titles are exact matches, and pairs
+    # with no shared title word from different subreddits are skipped
+    titles = [art['title'] for art in articles]
+    title_words = [frozenset(title.lower().split()) for title in titles]
+    scored = []
+    pairs_to_score = []
+    skipped = 0
+    for i, j in gated_pairs:
+        if titles[i] == titles[j]:
+            scored.append((i, j, 1.0, "exact_title"))
+        elif title_words[i].isdisjoint(title_words[j]) and \
+                articles[i].get('subreddit') != articles[j].get('subreddit'):
+            skipped += 1
+        else:
+            pairs_to_score.append((i, j))
+    if gated_pairs:
+        print(f"Title shortcuts: {len(scored)} exact, {skipped} unrelated skipped "
+              f"({(len(scored) + skipped) / len(gated_pairs) * 100:.1f}% of gated pairs)")
+
+    scored.extend(score_pairs_parallel(detector, texts, titles, pairs_to_score))
+    for i, j, sim_score, method in scored:
+        high_similarity_pairs.append({
+            'article1': titles[i][:60],
+            'article2': titles[j][:60],
+            'score': sim_score,
+            'method': method
+        })
+
+    # Sort by similarity score
+    high_similarity_pairs.sort(key=lambda x: x['score'], reverse=True)
 
-            # Limit content to 500 chars to simulate real insights
-            content1 = art1.get('content', '')[:500]
-            content2 = art2.get('content', '')[:500]
+    # Build the report and write it at once
+    out = []
+    if high_similarity_pairs:
+        out.append(f"\nFound {len(high_similarity_pairs)} pairs with similarity >= 0.5:")
+        out.append("-" * 70)
+        for i, pair in enumerate(high_similarity_pairs[:10], 1):  # Show top 10
+            out.append(f"\n{i}. Similarity: {pair['score']:.3f} ({pair['method']})")
+            out.append(f"   Article 1: {pair['article1']}...")
+            out.append(f"   Article 2: {pair['article2']}...")
+            if pair['score'] >= threshold:
+                out.append(f"   >>> WOULD BE MARKED AS DUPLICATE (threshold={threshold})")
+    else:
+        out.append("\nNo article pairs found with similarity >= 0.5")
+        out.append("This is expected for diverse news articles from different topics.")
+    sys.stdout.write("\n".join(out) + "\n")
 
-            text1 = f"{art1['title']}\n\n{content1}"
-            text2 = f"{art2['title']}\n\n{content2}"
 
-            sim_score, method = detector.check_similarity(
-                text1, text2,
-                art1['title'], art2['title']
-            )
+def _iter_similar_pairs(matrix, min_similarity: float, block_size: int = 256):
+    """
+    Yield (i, j, similarity) for i < j from row-normalized TF-IDF rows.
 
-            if sim_score >= 0.5:  # Show articles with moderate similarity
-                high_similarity_pairs.append({
-                    'article1': art1['title'][:60],
-                    'article2': art2['title'][:60],
-                    'score': sim_score,
-                    'method': method
-                })
+    The gram matrix is computed in block_size x block_size tiles (upper
+    triangle only) and filtered per tile, so the full N x N matrix is never held.
+    """
+    import numpy as np
 
-    # Sort by similarity score
-    high_similarity_pairs.sort(key=lambda x: x['score'], reverse=True)
+    n = matrix.shape[0]
+    for i0 in range(0, n, block_size):
+        rows_block = matrix[i0:i0 + block_size]
+        for j0 in range(i0, n, block_size):
+            tile = (rows_block @ matrix[j0:j0 + block_size].T).toarray()
+            rows, cols = np.nonzero(tile >= min_similarity)
+            for r, c in zip(rows.tolist(), cols.tolist()):
+                i, j = i0 + r, j0 + c
+                if i < j:
+                    yield i, j, float(tile[r, c])
+
+
+def build_shared_vectorizer(texts: list):
+    """
+    Fit one TF-IDF vectorizer on the whole corpus, shared by all test phases.
+
+    Returns:
+        Fitted TfidfVectorizer, or None if scikit-learn is unavailable
+    """
+    try:
+        from sklearn.feature_extraction.text import TfidfVectorizer
+    except ImportError:
+        return None
+
+    # Same parameters as the per-pair vectorizer in production; only the IDF is corpus-wide
+    vectorizer = TfidfVectorizer(**TFIDF_PARAMS)
+    try:
+        return vectorizer.fit(texts)
+    except ValueError:
+        return None
+
+
+def test_pairwise_similarity_batched(articles: list, detector: FastSimilarityDetector, threshold: float = 0.75,
+                                     texts: list = None, vectorizer=None):
+    """
+    Pairwise TF-IDF similarity computed in one sparse matrix product.
+
+    The vectorizer is fitted once on all texts and S = X @ X.T (computed in
+    tiles) gives every cosine similarity; the cascade only annotates pairs above 0.5.
+    """
+    print("\n" + "=" * 70)
+    print("BATCHED TF-IDF PAIRWISE SIMILARITY")
+    print("=" * 70)
+
+    try:
+        from sklearn.preprocessing import normalize
+    except ImportError:
+        print("\nscikit-learn not installed, skipping batched TF-IDF analysis")
+        return []
+
+    if texts is None:
+        texts = build_comparison_texts(articles)
+    if len(texts) < 2:
+        print("\nNot enough articles to compare")
+        return []
+
+    # Reuse the corpus-wide vectorizer when provided (no second vocabulary build)
+    if vectorizer is None:
+        vectorizer = build_shared_vectorizer(texts)
+        if vectorizer is None:
+            print("\nTF-IDF error: could not build a vocabulary")
+            return []
+    matrix = vectorizer.transform(texts)
+    normalize(matrix, copy=False)
+
+    high_similarity_pairs = []
+    for i, j, tfidf_sim in _iter_similar_pairs(matrix, 0.5):
+        art1 = articles[i]
+        art2 = articles[j]
+        sim_score, method = detector.check_similarity(texts[i], texts[j], art1['title'], art2['title'])
+        high_similarity_pairs.append({
+            'article1': art1['title'][:60],
+            'article2': art2['title'][:60],
+            'tfidf': float(tfidf_sim),
+            'score': sim_score,
+            'method': method
+        })
+
+    high_similarity_pairs.sort(key=lambda x: x['tfidf'], reverse=True)
 
     if high_similarity_pairs:
-        print(f"\nFound {len(high_similarity_pairs)} pairs with similarity >= 0.5:")
+        print(f"\nFound {len(high_similarity_pairs)} pairs with TF-IDF similarity >= 0.5:")
         print("-" * 70)
         for i, pair in enumerate(high_similarity_pairs[:10], 1):  # Show top 10
-            print(f"\n{i}. Similarity: {pair['score']:.3f} ({pair['method']})")
+            print(f"\n{i}. TF-IDF: {pair['tfidf']:.3f} | Cascade: {pair['score']:.3f} ({pair['method']})")
             print(f"   Article 1: {pair['article1']}...")
             print(f"   Article 2: {pair['article2']}...")
             if pair['score'] >= threshold:
                 print(f"   >>> WOULD BE MARKED AS DUPLICATE (threshold={threshold})")
     else:
-        print("\nNo article pairs found with similarity >= 0.5")
-        print("This is expected for diverse news articles from different topics.")
+        print("\nNo article pairs found with TF-IDF similarity >= 0.5")
+
+    return high_similarity_pairs
 
 
-def test_deduplication(articles: list):
+def test_deduplication(articles: list, tfidf_vectorizer=None):
     """
     Test the full deduplication pipeline.
     """
@@ -185,11 +582,8 @@ def test_deduplication(articles: list):
 
     print(f"\nInput: {len(analyzed_articles)} articles")
 
-    # Keep track of titles for comparison
-    original_titles = {a['metadata']['id']: a['title'] for a in analyzed_articles}
-
     # Initialize deduplicator with fast detection
-    dedup = ContentDeduplicator(use_fast_detection=True)  # Uses default threshold 0.68
+    dedup = ContentDeduplicator(use_fast_detection=True, tfidf_vectorizer=tfidf_vectorizer)  # Uses default threshold 0.68
 
     # Run deduplication
     start_time = time.time()
@@ -204,10 +598,7 @@ def test_deduplication(articles: list):
     # Show which articles were removed
     if len(analyzed_articles) > len(unique_articles):
         unique_ids = {a['metadata']['id'] for a in unique_articles}
-        removed = []
-        for article in analyzed_articles:
-            if article['metadata']['id'] not in unique_ids:
-                removed.append(article['title'][:60])
+        removed = [a['title'][:60] for a in analyzed_articles if a['metadata']['id'] not in unique_ids]
 
         if removed:
             print(f"\nArticles identified as duplicates:")
@@ -269,8 +660,7 @@ def test_synthetic_duplicates(articles: list, detector: FastSimilarityDetector):
         }
         test_cases.append(('AI Bubble Predictions', original, paraphrased))
 
-    print(f"\nTesting {len(test_cases)} synthetic duplicate pairs:")
-    print("-" * 70)
+    out = [f"\nTesting {len(test_cases)} synthetic duplicate pairs:", "-" * 70]
 
     for name, original, paraphrased in test_cases:
         text1 = f"{original['title']}\n\n{original['content']}"
@@ -283,11 +673,37 @@ def test_synthetic_duplicates(articles: list, detector: FastSimilarityDetector):
 
         is_duplicate = sim_score >= 0.55
 
-        print(f"\n{name}:")
-        print(f"  Original: {original['title'][:55]}...")
-        print(f"  Paraphrased: {paraphrased['title'][:55]}...")
-        print(f"  Similarity: {sim_score:.3f} ({method})")
-        print(f"  Detected as duplicate: {'YES' if is_duplicate else 'NO'}")
+        out.append(f"\n{name}:")
+        out.append(f"  Original: {original['title'][:55]}...")
+        out.append(f"  Paraphrased: {paraphrased['title'][:55]}...")
+        out.append(f"  Similarity: {sim_score:.3f} ({method})")
+        out.append(f"  Detected as duplicate: {'YES' if is_duplicate else 'NO'}")
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def run_phases_concurrently(phases: list) -> list:
+    """
+    Run independent test phases in threads and print their outputs in order.
+
+    Returns:
+        List of the phases' return values, in order
+    """
+    stdout = sys.stdout
+    proxy = ThreadBufferedStdout(stdout)
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            futures = [executor.submit(proxy.run_buffered, phase) for phase in phases]
+            outcomes = [future.result() for future in futures]
+    finally:
+        sys.stdout = stdout
+
+    results = []
+    for result, output in outcomes:
+        stdout.write(output)
+        results.append(result)
+    return results
 
 
 def main():
@@ -318,7 +734,7 @@ def main():
 
     # Parse the raw log
     print("\nParsing raw log file...")
-    articles = parse_reddit_raw_log(str(latest_log))
+    articles = parse_reddit_raw_log_cached(str(latest_log))
     print(f"Extracted {len(articles)} articles")
 
     # Show sample articles
@@ -326,21 +742,32 @@ def main():
     for i, art in enumerate(articles[:5], 1):
         print(f"  {i}. [{art.get('subreddit', 'N/A')}] {art['title'][:60]}...")
 
+    # Fit one TF-IDF vocabulary on the corpus, shared by every phase
+    texts = build_comparison_texts(articles)
+    vectorizer = build_shared_vectorizer(texts)
+
     # Initialize fast similarity detector
     detector = FastSimilarityDetector(
         simhash_threshold=0.8,
         tfidf_threshold=0.55,
-        title_weight=0.4
+        title_weight=0.4,
+        tfidf_vectorizer=vectorizer
     )
 
-    # Test 1: Pairwise similarity analysis
-    test_pairwise_similarity(articles, detector, threshold=0.68)
-
-    # Test 2: Synthetic duplicate detection
-    test_synthetic_duplicates(articles, detector)
-
-    # Test 3: Full deduplication pipeline
-    unique = test_deduplication(articles)
+    # The phases only read the shared articles: run them concurrently, each
+    # with its output buffered and printed in order afterwards
+    phases = [
+        # Test 1: Pairwise similarity analysis
+        lambda: test_pairwise_similarity(articles, detector, threshold=0.68, texts=texts),
+        lambda: test_pairwise_similarity_batched(articles, detector, threshold=0.68,
+                                                 texts=texts, vectorizer=vectorizer),
+        # Test 2: Synthetic duplicate detection
+        lambda: test_synthetic_duplicates(articles, detector),
+        # Test 3: Full deduplication pipeline
+        lambda: test_deduplication(articles, tfidf_vectorizer=vectorizer),
+    ]
+    results = run_phases_concurrently(phases)
+    unique = results[-1]
 
     # Summary
     print("\n" + "=" * 70)
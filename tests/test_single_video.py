@@ -2,12 +2,13 @@
 from pathlib import Path
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.append(str(Path.cwd()))
 
 from src.utils import load_env_variables, setup_logging
 from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
+from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound, TooManyRequests
 
 setup_logging()
 load_env_variables()
@@ -18,33 +19,64 @@ test_videos = [
     ("_WJr8HvrYHY", "NotebookLM Deep Research"),
 ]
 
-print("Waiting 30 seconds to avoid rate limiting...")
-time.sleep(30)
+# Back off on rate limiting instead of sleeping up front
+MAX_ATTEMPTS = 3
+BACKOFF_SECONDS = 10
 
-for video_id, title in test_videos:
-    print(f"\n=== Testing: {title} ===")
-    print(f"Video ID: {video_id}")
 
-    try:
-        # List available transcripts
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+def transcript_preview(transcript: list, limit: int) -> str:
+    """First `limit` characters of the space-joined transcript, without joining every segment"""
+    parts, size = [], 0
+    for entry in transcript:
+        parts.append(entry['text'])
+        size += len(entry['text']) + 1
+        if size > limit:
+            break
+    return " ".join(parts)[:limit]
 
-        print("Available transcripts:")
-        for t in transcript_list:
-            print(f"  - {t.language} ({t.language_code}) - Generated: {t.is_generated}")
 
-        # Try to get transcript
-        transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['en', 'fr'])
-        text = " ".join([entry['text'] for entry in transcript])
+def transcript_length(transcript: list) -> int:
+    """Length of the space-joined transcript text, computed without building it"""
+    return sum(len(entry['text']) for entry in transcript) + max(len(transcript) - 1, 0)
 
-        print(f"\n✅ SUCCESS!")
-        print(f"Transcript length: {len(text)} characters")
-        print(f"Preview: {text[:150]}...")
 
-    except (TranscriptsDisabled, NoTranscriptFound) as e:
-        print(f"❌ No transcript: {e}")
-    except Exception as e:
-        print(f"❌ Error: {e}")
+def fetch_transcript(video_id: str, title: str) -> str:
+    """Fetch one video's transcripts and return the report text (videos run concurrently)"""
+    lines = [f"\n=== Testing: {title} ===", f"Video ID: {video_id}"]
 
-    # Wait between videos
-    time.sleep(3)
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        try:
+            # List available transcripts
+            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+
+            lines.append("Available transcripts:")
+            for t in transcript_list:
+                lines.append(f"  - {t.language} ({t.language_code}) - Generated: {t.is_generated}")
+
+            # Try to get transcript
+            transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['en', 'fr'])
+
+            lines.append(f"\n✅ SUCCESS!")
+            lines.append(f"Transcript length: {transcript_length(transcript)} characters")
+            lines.append(f"Preview: {transcript_preview(transcript, 150)}...")
+
+        except TooManyRequests as e:
+            if attempt < MAX_ATTEMPTS:
+                delay = BACKOFF_SECONDS * 2 ** (attempt - 1)
+                lines.append(f"⏳ Rate limited, retrying in {delay}s...")
+                time.sleep(delay)
+                continue
+            lines.append(f"❌ Rate limited: {e}")
+        except (TranscriptsDisabled, NoTranscriptFound) as e:
+            lines.append(f"❌ No transcript: {e}")
+        except Exception as e:
+            lines.append(f"❌ Error: {e}")
+        break
+
+    return "\n".join(lines)
+
+
+# Fetches are network-bound and independent: run them in parallel, print in order
+with ThreadPoolExecutor(max_workers=len(test_videos)) as executor:
+    for report in executor.map(lambda video: fetch_transcript(*video), test_videos):
+        print(report)
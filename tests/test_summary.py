@@ -7,6 +7,7 @@ without running a full SCRIBE collection cycle.
 
 import os
 import logging
+from types import MappingProxyType
 from dotenv import load_dotenv
 from src.processors.ollama_client import OllamaClient
 from src.notifiers.discord_notifier import DiscordNotifier
@@ -20,8 +21,8 @@ logging.basicConfig(
 # Load environment variables
 load_dotenv()
 
-# Sample test data (simulating relevant contents)
-test_contents = [
+# Sample test data (simulating relevant contents), read-only and shared by all tests
+test_contents = tuple(MappingProxyType(content) for content in [
     {
         'translated_title': 'GPT-5 annoncé avec des capacités de raisonnement améliorées',
         'category': 'Large Language Models',
@@ -57,7 +58,7 @@ test_contents = [
         'insights': '• Réduction de 30% du temps de traitement\n• IA de vision pour navigation autonome',
         'relevance_score': 8
     }
-]
+])
 
 def test_summary_generation():
     """Test the summary generation with Ollama"""
@@ -111,23 +112,22 @@ def test_discord_webhook(summary_text):
 
     try:
         # Initialize Discord notifier
-        notifier = DiscordNotifier()
-
-        # Send summary
-        print(f"\nSending summary to webhook...")
-        print(f"Webhook: {webhook_url[:50]}...")
-
-        success = notifier.send_summary(
-            summary_text=summary_text,
-            mention_role=""  # No mention for testing
-        )
-
-        if success:
-            print("\n✓ Summary sent successfully to Discord!")
-            return True
-        else:
-            print("\n❌ Failed to send summary to Discord")
-            return False
+        with DiscordNotifier() as notifier:
+            # Send summary
+            print(f"\nSending summary to webhook...")
+            print(f"Webhook: {webhook_url[:50]}...")
+
+            success = notifier.send_summary(
+                summary_text=summary_text,
+                mention_role=""  # No mention for testing
+            )
+
+            if success:
+                print("\n✓ Summary sent successfully to Discord!")
+                return True
+            else:
+                print("\n❌ Failed to send summary to Discord")
+                return False
 
     except Exception as e:
         print(f"\n❌ Error sending to Discord: {e}")
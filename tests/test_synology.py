@@ -3,6 +3,7 @@
 
 import os
 import sys
+import asyncio
 from pathlib import Path
 
 # Add parent directory to path
@@ -11,12 +12,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.notifiers.synology_notifier import SynologyNotifier
 from src.utils import load_env_variables
 
+# Section separator for the console report
+SEP = "=" * 60
+
 
 def test_synology_connection():
     """Test basic Synology Chat webhook connection"""
-    print("=" * 60)
+    print(SEP)
     print("SYNOLOGY CHAT WEBHOOK TEST")
-    print("=" * 60)
+    print(SEP)
 
     # Load environment variables
     print("\n1. Loading environment variables...")
@@ -51,21 +55,9 @@ def test_synology_connection():
         print(f"   ✗ Failed to initialize notifier: {e}")
         return False
 
-    # Test simple message
-    print("\n3. Testing simple message...")
-    try:
-        success = notifier._send_message("🤖 SCRIBE Test Message\n\nThis is a test message from SCRIBE to verify Synology Chat webhook integration.")
-        if success:
-            print("   ✓ Simple message sent successfully!")
-        else:
-            print("   ✗ Failed to send simple message")
-            return False
-    except Exception as e:
-        print(f"   ✗ Error sending simple message: {e}")
-        return False
+    # Build every test message first, then send them all concurrently
+    simple_message = "🤖 SCRIBE Test Message\n\nThis is a test message from SCRIBE to verify Synology Chat webhook integration."
 
-    # Test formatted message
-    print("\n4. Testing formatted message...")
     test_content = {
         'title': 'Test Title: Synology Chat Integration',
         'translated_title': 'Integration de Synology Chat',
@@ -81,40 +73,67 @@ def test_synology_connection():
         }
     }
 
-    try:
-        message = notifier._create_content_message(test_content, 'AI Tools & Applications')
-        success = notifier._send_message(message)
-        if success:
-            print("   ✓ Formatted message sent successfully!")
-        else:
-            print("   ✗ Failed to send formatted message")
-            return False
-    except Exception as e:
-        print(f"   ✗ Error sending formatted message: {e}")
-        return False
-
-    # Test message splitting
-    print("\n5. Testing message splitting (long message)...")
     long_message = "LONG MESSAGE TEST\n\n" + ("Lorem ipsum dolor sit amet. " * 200)
     try:
+        formatted_message = notifier._create_content_message(test_content, 'AI Tools & Applications')
         chunks = notifier._split_message(long_message)
-        print(f"   ✓ Message split into {len(chunks)} chunk(s)")
-
-        if len(chunks) > 1:
-            print(f"   Testing sending {len(chunks)} chunks...")
-            for i, chunk in enumerate(chunks[:2], 1):  # Only send first 2 chunks to avoid spam
-                success = notifier._send_message(chunk)
-                if success:
-                    print(f"   ✓ Chunk {i}/{min(2, len(chunks))} sent")
-                else:
-                    print(f"   ✗ Failed to send chunk {i}")
     except Exception as e:
-        print(f"   ✗ Error testing message splitting: {e}")
+        print(f"   ✗ Error building test messages: {e}")
         return False
 
-    print("\n" + "=" * 60)
+    # Only send first 2 chunks to avoid spam
+    sent_chunks = chunks[:2] if len(chunks) > 1 else []
+
+    async def send_all():
+        return await asyncio.gather(
+            notifier._send_message_async(simple_message),
+            notifier._send_message_async(formatted_message),
+            *(notifier._send_message_async(chunk) for chunk in sent_chunks),
+            return_exceptions=True
+        )
+
+    print("\n3-5. Sending simple, formatted and split messages concurrently...")
+    simple_result, formatted_result, *chunk_results = asyncio.run(send_all())
+
+    # Test simple message
+    print("\n3. Testing simple message...")
+    if isinstance(simple_result, Exception):
+        print(f"   ✗ Error sending simple message: {simple_result}")
+        return False
+    if simple_result:
+        print("   ✓ Simple message sent successfully!")
+    else:
+        print("   ✗ Failed to send simple message")
+        return False
+
+    # Test formatted message
+    print("\n4. Testing formatted message...")
+    if isinstance(formatted_result, Exception):
+        print(f"   ✗ Error sending formatted message: {formatted_result}")
+        return False
+    if formatted_result:
+        print("   ✓ Formatted message sent successfully!")
+    else:
+        print("   ✗ Failed to send formatted message")
+        return False
+
+    # Test message splitting
+    print("\n5. Testing message splitting (long message)...")
+    print(f"   ✓ Message split into {len(chunks)} chunk(s)")
+    if sent_chunks:
+        print(f"   Testing sending {len(chunks)} chunks...")
+        for i, success in enumerate(chunk_results, 1):
+            if isinstance(success, Exception):
+                print(f"   ✗ Error testing message splitting: {success}")
+                return False
+            if success:
+                print(f"   ✓ Chunk {i}/{len(sent_chunks)} sent")
+            else:
+                print(f"   ✗ Failed to send chunk {i}")
+
+    print("\n" + SEP)
     print("ALL TESTS PASSED ✓")
-    print("=" * 60)
+    print(SEP)
     print("\nYour Synology Chat webhook is working correctly!")
     print("You can now enable Synology notifications in your package settings.yaml")
     return True
@@ -122,9 +141,9 @@ def test_synology_connection():
 
 def test_synology_summary():
     """Test Synology Chat summary webhook"""
-    print("\n" + "=" * 60)
+    print("\n" + SEP)
     print("SYNOLOGY CHAT SUMMARY WEBHOOK TEST")
-    print("=" * 60)
+    print(SEP)
 
     # Check for summary webhook URL
     summary_webhook_url = os.getenv('SYNOLOGY_AI_TRENDS_SUMMARY_WEBHOOK')
@@ -1,6 +1,7 @@
 """Debug transcript retrieval"""
 from pathlib import Path
 import sys
+import asyncio
 
 sys.path.append(str(Path.cwd()))
 
@@ -20,37 +21,68 @@ videos = collector._search_by_keyword("AI research", max_results=5, days_back=7)
 
 print(f'\nFound {len(videos)} videos')
 
-# Test transcripts manually
-for i, video in enumerate(videos[:3], 1):
+def transcript_preview(transcript: list, limit: int) -> str:
+    """First `limit` characters of the space-joined transcript, without joining every segment"""
+    parts, size = [], 0
+    for entry in transcript:
+        parts.append(entry['text'])
+        size += len(entry['text']) + 1
+        if size > limit:
+            break
+    return " ".join(parts)[:limit]
+
+
+def transcript_length(transcript: list) -> int:
+    """Length of the space-joined transcript text, computed without building it"""
+    return sum(len(entry['text']) for entry in transcript) + max(len(transcript) - 1, 0)
+
+
+def probe_video(i: int, video: dict) -> str:
+    """Probe one video's transcripts and return the report text (videos are probed concurrently)"""
     video_id = video['video_id']
-    print(f'\n--- Video {i} ---')
-    print(f'Title: {video["title"]}')
-    print(f'Channel: {video["channel_title"]}')
-    print(f'Video ID: {video_id}')
-    print(f'URL: {video["url"]}')
+    lines = [
+        f'\n--- Video {i} ---',
+        f'Title: {video["title"]}',
+        f'Channel: {video["channel_title"]}',
+        f'Video ID: {video_id}',
+        f'URL: {video["url"]}',
+    ]
 
     # Try to get transcript list
     try:
         transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
 
-        print(f'\nAvailable transcripts:')
+        lines.append(f'\nAvailable transcripts:')
         for transcript in transcript_list:
-            print(f'  - {transcript.language} ({transcript.language_code}) - Generated: {transcript.is_generated}')
+            lines.append(f'  - {transcript.language} ({transcript.language_code}) - Generated: {transcript.is_generated}')
 
         # Try to get transcript in fr/en
         try:
             transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=['fr', 'en'])
-            print(f'\nTranscript retrieved successfully!')
-            print(f'Length: {len(transcript)} segments')
-            text = " ".join([entry['text'] for entry in transcript])
-            print(f'Total text length: {len(text)} characters')
-            print(f'Preview: {text[:200]}...')
+            lines.append(f'\nTranscript retrieved successfully!')
+            lines.append(f'Length: {len(transcript)} segments')
+            lines.append(f'Total text length: {transcript_length(transcript)} characters')
+            lines.append(f'Preview: {transcript_preview(transcript, 200)}...')
         except (TranscriptsDisabled, NoTranscriptFound) as e:
-            print(f'\nNo transcript available in fr/en: {e}')
+            lines.append(f'\nNo transcript available in fr/en: {e}')
 
     except TranscriptsDisabled:
-        print(f'\nTranscripts are disabled for this video')
+        lines.append(f'\nTranscripts are disabled for this video')
     except NoTranscriptFound:
-        print(f'\nNo transcripts found for this video')
+        lines.append(f'\nNo transcripts found for this video')
     except Exception as e:
-        print(f'\nError: {e}')
+        lines.append(f'\nError: {e}')
+
+    return "\n".join(lines)
+
+
+async def probe_videos(videos: list) -> list:
+    """Probe all videos in parallel (independent network calls), keeping their order"""
+    return await asyncio.gather(*(
+        asyncio.to_thread(probe_video, i, video) for i, video in enumerate(videos, 1)
+    ))
+
+
+# Test transcripts manually
+for report in asyncio.run(probe_videos(videos[:3])):
+    print(report)
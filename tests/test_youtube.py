@@ -12,26 +12,32 @@ load_env_variables()
 
 collector = YouTubeCollector()
 
+cfg = collector.youtube_config
 print(f'\nConfiguration YouTube:')
-print(f'Keywords: {collector.youtube_config.get("keywords")}')
-print(f'Channels: {collector.youtube_config.get("channels")}')
-print(f'Videos limit: {collector.youtube_config.get("videos_limit")}')
-print(f'Days back: {collector.youtube_config.get("days_back")}')
-print(f'Languages: {collector.youtube_config.get("languages")}')
+print(f'Keywords: {cfg.get("keywords")}')
+print(f'Channels: {cfg.get("channels")}')
+print(f'Videos limit: {cfg.get("videos_limit")}')
+print(f'Days back: {cfg.get("days_back")}')
+print(f'Languages: {cfg.get("languages")}')
 
 print(f'\n=== COLLECTE EN COURS ===')
 videos = collector.collect_videos()
 
-print(f'\n=== RESULTATS ===')
-print(f'Total videos avec transcripts: {len(videos)}')
+# Results are collected and written in one go
+lines = [
+    f'\n=== RESULTATS ===',
+    f'Total videos avec transcripts: {len(videos)}',
+]
 
 for i, v in enumerate(videos, 1):
-    print(f'\n{i}. {v["title"]}')
-    print(f'   Channel: {v["channel_title"]}')
-    print(f'   URL: {v["url"]}')
-    print(f'   Published: {v["published_at"]}')
+    lines.append(f'\n{i}. {v["title"]}')
+    lines.append(f'   Channel: {v["channel_title"]}')
+    lines.append(f'   URL: {v["url"]}')
+    lines.append(f'   Published: {v["published_at"]}')
     has_transcript = v.get("transcript") is not None
     transcript_len = len(v.get("transcript", ""))
-    print(f'   Transcript: {"OUI" if has_transcript else "NON"} ({transcript_len} chars)')
+    lines.append(f'   Transcript: {"OUI" if has_transcript else "NON"} ({transcript_len} chars)')
     if has_transcript:
-        print(f'   Preview: {v["transcript"][:200]}...')
+        lines.append(f'   Preview: {v["transcript"][:200]}...')
+
+sys.stdout.write("\n".join(lines) + "\n")
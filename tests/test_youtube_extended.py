@@ -15,17 +15,22 @@ collector = YouTubeCollector()
 print(f'\n=== TEST WITH 7 DAYS BACK ===')
 videos = collector.collect_videos(days_back=7, videos_limit=2)
 
-print(f'\n=== RESULTATS ===')
-print(f'Total videos avec transcripts: {len(videos)}')
+# Results are collected and written in one go
+lines = [
+    f'\n=== RESULTATS ===',
+    f'Total videos avec transcripts: {len(videos)}',
+]
 
 for i, v in enumerate(videos, 1):
-    print(f'\n{i}. {v["title"]}')
-    print(f'   Channel: {v["channel_title"]}')
-    print(f'   URL: {v["url"]}')
-    print(f'   Published: {v["published_at"]}')
-    print(f'   Source query: {v["source_query"]}')
+    lines.append(f'\n{i}. {v["title"]}')
+    lines.append(f'   Channel: {v["channel_title"]}')
+    lines.append(f'   URL: {v["url"]}')
+    lines.append(f'   Published: {v["published_at"]}')
+    lines.append(f'   Source query: {v["source_query"]}')
     has_transcript = v.get("transcript") is not None
     transcript_len = len(v.get("transcript", ""))
-    print(f'   Transcript: {"OUI" if has_transcript else "NON"} ({transcript_len} chars)')
+    lines.append(f'   Transcript: {"OUI" if has_transcript else "NON"} ({transcript_len} chars)')
     if has_transcript:
-        print(f'   Preview: {v["transcript"][:150]}...')
+        lines.append(f'   Preview: {v["transcript"][:150]}...')
+
+sys.stdout.write("\n".join(lines) + "\n")
@@ -2,6 +2,8 @@
 
 import os
 import sys
+import asyncio
+from functools import lru_cache
 from pathlib import Path
 
 # Add project root to path
@@ -10,60 +12,103 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from dotenv import load_dotenv
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
-from googleapiclient.discovery import build
+
+from src.collectors.youtube_collector import YouTubeCollector
+from src.package_manager import PackageManager
 
 load_dotenv()
 
+# Package whose settings drive the collector
+PACKAGE_NAME = "ai_trends"
+
+# Section separator for the console report
+SEP = "=" * 60
+
+# Maximum transcript probes in flight at once
+MAX_CONCURRENT_PROBES = 4
+
+# Transcript API shared by all tests (v1.x style), so its HTTP session keeps connections alive
+TRANSCRIPT_API = YouTubeTranscriptApi()
+
+
+@lru_cache(maxsize=1)
+def _collector(package_name: str) -> YouTubeCollector:
+    """Build the package's YouTubeCollector once, shared by the channel lookup and the full collector test"""
+    pkg = PackageManager().load_package(package_name)
+    return YouTubeCollector(config=pkg.settings)
+
+
+def transcript_preview(transcript, limit: int) -> str:
+    """First `limit` characters of the space-joined transcript, without joining every segment"""
+    parts, size = [], 0
+    for entry in transcript:
+        parts.append(entry.text)
+        size += len(entry.text) + 1
+        if size > limit:
+            break
+    return " ".join(parts)[:limit]
+
+
+def transcript_length(transcript) -> int:
+    """Length of the space-joined transcript text, computed without building it"""
+    return sum(len(entry.text) for entry in transcript) + max(len(transcript) - 1, 0)
+
 
 def test_transcript_single_video(video_id: str, languages: list = None):
-    """Test transcript retrieval for a single video"""
+    """Test transcript retrieval for a single video (output is written in one go, videos may run concurrently)"""
 
     if languages is None:
         languages = ['en', 'fr']
 
-    print(f"\n{'='*60}")
-    print(f"Testing video: {video_id}")
-    print(f"URL: https://www.youtube.com/watch?v={video_id}")
-    print(f"Languages: {languages}")
-    print('='*60)
+    lines = [
+        f"\n{SEP}",
+        f"Testing video: {video_id}",
+        f"URL: https://www.youtube.com/watch?v={video_id}",
+        f"Languages: {languages}",
+        SEP,
+    ]
 
     try:
-        # Initialize API (v1.x style)
-        api = YouTubeTranscriptApi()
+        return _fetch_transcript(video_id, languages, lines)
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _fetch_transcript(video_id: str, languages: list, lines: list):
+    """List and fetch one video's transcript, collecting the report in lines"""
+    try:
+        api = TRANSCRIPT_API
 
         # First, list available transcripts
-        print("\n1. Listing available transcripts...")
+        lines.append("\n1. Listing available transcripts...")
         transcript_list = api.list(video_id)
 
-        print(f"   Available transcripts:")
+        lines.append(f"   Available transcripts:")
         for t in transcript_list:
-            print(f"   - {t.language} ({t.language_code}) - Generated: {t.is_generated}")
+            lines.append(f"   - {t.language} ({t.language_code}) - Generated: {t.is_generated}")
 
         # Try to fetch transcript
-        print(f"\n2. Fetching transcript in {languages}...")
+        lines.append(f"\n2. Fetching transcript in {languages}...")
         transcript = api.fetch(video_id, languages=languages)
 
-        # Get text
-        full_text = " ".join([entry.text for entry in transcript])
-
-        print(f"\n3. SUCCESS! Transcript retrieved:")
-        print(f"   - Segments: {len(transcript)}")
-        print(f"   - Total characters: {len(full_text)}")
-        print(f"\n   First 500 characters:")
-        print(f"   {full_text[:500]}...")
+        lines.append(f"\n3. SUCCESS! Transcript retrieved:")
+        lines.append(f"   - Segments: {len(transcript)}")
+        lines.append(f"   - Total characters: {transcript_length(transcript)}")
+        lines.append(f"\n   First 500 characters:")
+        lines.append(f"   {transcript_preview(transcript, 500)}...")
 
-        return True, full_text
+        return True, transcript
 
     except TranscriptsDisabled:
-        print("\n   ERROR: Transcripts are disabled for this video")
+        lines.append("\n   ERROR: Transcripts are disabled for this video")
         return False, None
 
     except NoTranscriptFound:
-        print(f"\n   ERROR: No transcript found in languages {languages}")
+        lines.append(f"\n   ERROR: No transcript found in languages {languages}")
         return False, None
 
     except Exception as e:
-        print(f"\n   ERROR: {type(e).__name__}: {e}")
+        lines.append(f"\n   ERROR: {type(e).__name__}: {e}")
         return False, None
 
 
@@ -75,7 +120,7 @@ def get_recent_videos_from_channel(channel_handle: str, max_results: int = 3):
         print("ERROR: YOUTUBE_API_KEY not found in .env")
         return []
 
-    youtube = build('youtube', 'v3', developerKey=api_key)
+    youtube = _collector(PACKAGE_NAME).youtube
 
     # First, find channel ID from handle
     print(f"\n1. Finding channel ID for {channel_handle}...")
@@ -114,9 +159,20 @@ def get_recent_videos_from_channel(channel_handle: str, max_results: int = 3):
     return videos
 
 
+async def probe_videos(video_ids: list, languages: list = None) -> list:
+    """Run test_transcript_single_video for several videos at once, at most MAX_CONCURRENT_PROBES at a time"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBES)
+
+    async def probe(video_id: str):
+        async with semaphore:
+            return await asyncio.to_thread(test_transcript_single_video, video_id, languages)
+
+    return await asyncio.gather(*(probe(video_id) for video_id in video_ids))
+
+
 def main():
     print("YouTube Transcript API Test")
-    print("="*60)
+    print(SEP)
 
     # You can test with a specific video ID
     if len(sys.argv) > 1:
@@ -131,17 +187,20 @@ def main():
             print("Could not fetch videos from channel. Testing with known video.")
             test_videos = [("dQw4w9WgXcQ", "Fallback test video")]
 
-    results = []
-
-    for video_id, description in test_videos:
+    for _, description in test_videos:
         print(f"\n\nTesting transcript: {description}")
-        success, _ = test_transcript_single_video(video_id)
-        results.append((video_id, description, success))
+
+    # Probe all videos concurrently (capped to stay clear of YouTube rate limiting)
+    outcomes = asyncio.run(probe_videos([video_id for video_id, _ in test_videos]))
+    results = [
+        (video_id, description, success)
+        for (video_id, description), (success, _) in zip(test_videos, outcomes)
+    ]
 
     # Summary
-    print("\n\n" + "="*60)
+    print("\n\n" + SEP)
     print("SUMMARY")
-    print("="*60)
+    print(SEP)
 
     for video_id, description, success in results:
         status = "[OK]" if success else "[FAIL]"
@@ -154,22 +213,15 @@ def main():
 def test_full_collector():
     """Test the full YouTubeCollector flow"""
 
-    print("\n\n" + "="*60)
+    print("\n\n" + SEP)
     print("TESTING FULL YOUTUBE COLLECTOR")
-    print("="*60)
-
-    from src.collectors.youtube_collector import YouTubeCollector
-    from src.package_manager import PackageManager
-
-    # Load package config
-    pm = PackageManager()
-    pkg = pm.load_package("ai_trends")
+    print(SEP)
 
-    print(f"\nPackage loaded: {pkg.name}")
-    print(f"YouTube config: {pkg.settings.get('youtube', {})}")
+    # Same collector as the channel lookup in main(), so its API clients are reused
+    collector = _collector(PACKAGE_NAME)
 
-    # Initialize collector
-    collector = YouTubeCollector(config=pkg.settings)
+    print(f"\nPackage loaded: {PACKAGE_NAME}")
+    print(f"YouTube config: {collector.youtube_config}")
 
     # Test with just one channel to avoid API limits
     print("\n\nCollecting videos from @aiexplained-official only...")